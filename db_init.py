@@ -7,42 +7,90 @@ It creates tables, sets up migrations, and provides utility functions for databa
 
 import os
 import sys
+from functools import lru_cache
 from flask import Flask
-from flask_migrate import Migrate
+from sqlalchemy import event, select
+from sqlalchemy.pool import QueuePool, StaticPool
 from models import db, ScanHistory, EmailCleanRecord, UserSettings
 
+# Primary key of the single UserSettings row
+SETTINGS_ID = 1
+
+def _engine_options(database_uri):
+    """Return engine options suited to the configured database"""
+    if database_uri.startswith('sqlite') and ':memory:' in database_uri:
+        # An in-memory database only lives as long as its connection,
+        # so every checkout has to share the same one
+        return {
+            'poolclass': StaticPool,
+            'connect_args': {'check_same_thread': False},
+        }
+    if database_uri.startswith('sqlite'):
+        return {
+            'poolclass': QueuePool,
+            'pool_pre_ping': True,
+            'connect_args': {'check_same_thread': False},
+        }
+    return {
+        'pool_recycle': 300,
+        'pool_pre_ping': True,
+    }
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply the SQLite PRAGMAs to each new connection"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.close()
+
 def create_app():
     """Create and configure the Flask application"""
     app = Flask(__name__)
     
     # Configure the database
-    app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///emails.db')
+    database_uri = os.environ.get('DATABASE_URL', 'sqlite:///emails.db')
+    app.config['SQLALCHEMY_DATABASE_URI'] = database_uri
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
-        'pool_recycle': 300,
-        'pool_pre_ping': True,
-    }
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = _engine_options(database_uri)
     
     # Initialize extensions
     db.init_app(app)
     
+    # File-backed SQLite: write-ahead logging lets readers run alongside a
+    # writer, and NORMAL sync avoids a full fsync on every commit
+    if database_uri.startswith('sqlite') and ':memory:' not in database_uri:
+        with app.app_context():
+            event.listen(db.engine, 'connect', _set_sqlite_pragmas)
+    
     # Create migration instance
-    # This will be initialized in the app context when needed
+    # Flask-Migrate (and Alembic behind it) is only imported here, so importing
+    # this module for the helpers alone stays cheap
+    from flask_migrate import Migrate
     app.migrate = Migrate(app, db)
     
     return app
 
+@lru_cache(maxsize=1)
+def get_app():
+    """Return the shared Flask application, creating it on first use.
+
+    The helpers below all run inside this single app so the engine and its
+    connection pool are set up once instead of on every call.
+    """
+    return create_app()
+
 def init_db():
     """Initialize the database with tables"""
-    app = create_app()
+    app = get_app()
     
     with app.app_context():
         # Create all tables
         db.create_all()
         
         # Create default user settings if not exist
-        if not UserSettings.query.first():
+        if not _find_user_settings():
             default_settings = UserSettings(
+                id=SETTINGS_ID,
                 default_client='all',
                 default_criteria='strict',
                 auto_clean=False
@@ -54,9 +102,7 @@ def init_db():
 
 def add_scan_history(client_type, folder_path, criteria, total_emails, duplicate_groups, duplicate_emails):
     """Add a new scan history record to the database"""
-    app = create_app()
-    
-    with app.app_context():
+    with get_app().app_context():
         scan = ScanHistory(
             client_type=client_type,
             folder_path=folder_path,
@@ -71,9 +117,7 @@ def add_scan_history(client_type, folder_path, criteria, total_emails, duplicate
 
 def add_clean_record(scan_id, cleaned_count, error_count, selection_method):
     """Add a new cleaning record to the database"""
-    app = create_app()
-    
-    with app.app_context():
+    with get_app().app_context():
         clean_record = EmailCleanRecord(
             scan_id=scan_id,
             cleaned_count=cleaned_count,
@@ -84,15 +128,65 @@ def add_clean_record(scan_id, cleaned_count, error_count, selection_method):
         db.session.commit()
         return clean_record.id
 
-def get_user_settings():
-    """Get the current user settings"""
-    app = create_app()
+def add_scan_history_bulk(rows):
+    """Add several scan history records in a single transaction
+
+    Each row is a dictionary with the same keys as the arguments of
+    add_scan_history. Returns the number of inserted records.
+    """
+    rows = list(rows)
+    if not rows:
+        return 0
     
-    with app.app_context():
+    with get_app().app_context():
+        try:
+            db.session.bulk_insert_mappings(ScanHistory, rows)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        return len(rows)
+
+def add_clean_records_bulk(rows):
+    """Add several cleaning records in a single transaction
+
+    Each row is a dictionary with the same keys as the arguments of
+    add_clean_record. Returns the number of inserted records.
+    """
+    rows = list(rows)
+    if not rows:
+        return 0
+    
+    with get_app().app_context():
+        try:
+            db.session.bulk_insert_mappings(EmailCleanRecord, rows)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        return len(rows)
+
+def _find_user_settings():
+    """Return the settings row, or None if it does not exist yet
+
+    Must be called inside an app context. The row normally has the fixed
+    primary key SETTINGS_ID, so this is a primary-key lookup that can be
+    served from the session identity map. Databases created before the id
+    was pinned fall back to the first row.
+    """
+    settings = db.session.get(UserSettings, SETTINGS_ID)
+    if settings is None:
         settings = UserSettings.query.first()
+    return settings
+
+def get_user_settings():
+    """Get the current user settings"""
+    with get_app().app_context():
+        settings = _find_user_settings()
         if not settings:
             # Create default settings if not exist
             settings = UserSettings(
+                id=SETTINGS_ID,
                 default_client='all',
                 default_criteria='strict',
                 auto_clean=False
@@ -109,12 +203,10 @@ def get_user_settings():
 
 def update_user_settings(settings_dict):
     """Update user settings with the provided dictionary"""
-    app = create_app()
-    
-    with app.app_context():
-        settings = UserSettings.query.first()
+    with get_app().app_context():
+        settings = _find_user_settings()
         if not settings:
-            settings = UserSettings()
+            settings = UserSettings(id=SETTINGS_ID)
             db.session.add(settings)
         
         # Update settings with provided values
@@ -126,35 +218,55 @@ def update_user_settings(settings_dict):
 
 def get_scan_history(limit=10):
     """Get recent scan history entries"""
-    app = create_app()
-    
-    with app.app_context():
-        scans = ScanHistory.query.order_by(ScanHistory.timestamp.desc()).limit(limit).all()
+    with get_app().app_context():
+        # Fetch the scans and their cleaning records in one round trip
+        # instead of lazy-loading cleaning_records for every scan
+        scans = ScanHistory.__table__
+        records = EmailCleanRecord.__table__
+        recent = (
+            select(scans)
+            .order_by(scans.c.timestamp.desc())
+            .limit(limit)
+            .subquery()
+        )
+        query = (
+            select(
+                *recent.c,
+                records.c.id.label('record_id'),
+                records.c.cleaned_count,
+                records.c.error_count,
+                records.c.selection_method,
+                records.c.timestamp.label('record_timestamp')
+            )
+            .outerjoin(records, records.c.scan_id == recent.c.id)
+            .order_by(recent.c.timestamp.desc(), records.c.id)
+        )
         
-        results = []
-        for scan in scans:
-            cleaning_records = []
-            for record in scan.cleaning_records:
-                cleaning_records.append({
-                    'cleaned_count': record.cleaned_count,
-                    'error_count': record.error_count,
-                    'selection_method': record.selection_method,
-                    'timestamp': record.timestamp.strftime('%Y-%m-%d %H:%M:%S')
-                })
+        results = {}
+        for row in db.session.execute(query).mappings():
+            scan = results.get(row['id'])
+            if scan is None:
+                scan = results[row['id']] = {
+                    'id': row['id'],
+                    'client_type': row['client_type'],
+                    'folder_path': row['folder_path'],
+                    'criteria': row['criteria'],
+                    'total_emails': row['total_emails'],
+                    'duplicate_groups': row['duplicate_groups'],
+                    'duplicate_emails': row['duplicate_emails'],
+                    'timestamp': row['timestamp'].strftime('%Y-%m-%d %H:%M:%S'),
+                    'cleaning_records': []
+                }
             
-            results.append({
-                'id': scan.id,
-                'client_type': scan.client_type,
-                'folder_path': scan.folder_path,
-                'criteria': scan.criteria,
-                'total_emails': scan.total_emails,
-                'duplicate_groups': scan.duplicate_groups,
-                'duplicate_emails': scan.duplicate_emails,
-                'timestamp': scan.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
-                'cleaning_records': cleaning_records
-            })
+            if row['record_id'] is not None:
+                scan['cleaning_records'].append({
+                    'cleaned_count': row['cleaned_count'],
+                    'error_count': row['error_count'],
+                    'selection_method': row['selection_method'],
+                    'timestamp': row['record_timestamp'].strftime('%Y-%m-%d %H:%M:%S')
+                })
         
-        return results
+        return list(results.values())
 
 if __name__ == "__main__":
     # If run as a script, initialize the database
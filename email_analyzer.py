@@ -10,28 +10,454 @@ Provides advanced analysis of email collections including:
 - Duplicate detection with different matching strategies
 """
 
-from typing import Dict, List, Tuple, Any, Optional, DefaultDict
+from typing import Dict, List, Tuple, Any, Optional, DefaultDict, Iterable, Callable, Generator, Union, TextIO
 from collections import defaultdict, Counter
+from array import array
 import email
+import email.message
 import email.utils
 import re
-from datetime import datetime
+import statistics
+from datetime import datetime, date, timedelta
 import logging
 from pathlib import Path
 import os
+import time
+import importlib
+import io
+from functools import lru_cache
+from types import ModuleType
 
-# Try to import optional dependencies
-try:
-    import pandas as pd
-    PANDAS_AVAILABLE = True
-except ImportError:
-    PANDAS_AVAILABLE = False
+# Optional dependencies are imported on first use, so plain analysis does not
+# pay the import time and memory of pandas, numpy or matplotlib up front
+@lru_cache(maxsize=None)
+def _import_optional(module_name: str) -> Optional[ModuleType]:
+    """Import an optional module once, returning None if it is not installed."""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        return None
+
+def _get_pandas() -> Optional[ModuleType]:
+    return _import_optional('pandas')
+
+def _get_numpy() -> Optional[ModuleType]:
+    return _import_optional('numpy')
+
+def _get_pyplot() -> Optional[ModuleType]:
+    return _import_optional('matplotlib.pyplot')
+
+# Precompiled patterns used by the per-message analysis loops
+_FROM_RE = re.compile(r'<([^>]+)>')
+_SUBJ_RE = re.compile(r'^\s*(re|fwd?):\s*', re.IGNORECASE)
+
+def _local_utc_offset(timestamp: int) -> int:
+    """Return the local UTC offset in seconds at the given timestamp."""
+    return time.localtime(timestamp).tm_gmtoff
+
+
+def _calculate_stats(values: List[float]) -> Dict[str, float]:
+    """Calculate basic statistics for a list of numeric values."""
+    if not values:
+        return {}
+
+    pd = _get_pandas()
+    if pd is not None:
+        s = pd.Series(values)
+        return {
+            'count': len(values),
+            'mean': s.mean(),
+            'median': s.median(),
+            'min': s.min(),
+            'max': s.max(),
+            'std': s.std(),
+            '25%': s.quantile(0.25),
+            '50%': s.quantile(0.5),
+            '75%': s.quantile(0.75)
+        }
+
+    np = _get_numpy()
+    if np is not None:
+        # np.median selects the middle values with a partition, no full sort
+        arr = np.asarray(values)
+        return {
+            'count': len(values),
+            'mean': arr.mean().item(),
+            'median': np.median(arr).item(),
+            'min': arr.min().item(),
+            'max': arr.max().item()
+        }
+
+    # Fallback implementation without pandas or numpy
+    n = len(values)
+    return {
+        'count': n,
+        'mean': sum(values) / n,
+        'median': statistics.median(values),
+        'min': min(values),
+        'max': max(values)
+    }
+
+
+class MessageColumns:
+    """Column-oriented storage for the message fields used by the analyzers.
+    
+    Instead of one dictionary per message, each field is kept in its own
+    list and messages are addressed by position. This drops the per-message
+    dict overhead and lets the analyzers walk only the columns they need.
+    """
+    
+    __slots__ = ('from_', 'date', 'subject', 'in_reply_to', 'references',
+                 'message_id', 'body', 'attachments')
+    
+    def __init__(self):
+        self.from_: List[str] = []
+        self.date: List[Optional[str]] = []
+        self.subject: List[str] = []
+        self.in_reply_to: List[Optional[str]] = []
+        self.references: List[Optional[str]] = []
+        self.message_id: List[str] = []
+        self.body: List[Any] = []
+        self.attachments: List[Optional[List[Dict[str, Any]]]] = []
+    
+    def __len__(self) -> int:
+        return len(self.date)
+    
+    def append(self, msg: Dict[str, Any]) -> None:
+        """Append the fields of one message dictionary."""
+        self.from_.append(msg.get('from', ''))
+        self.date.append(msg.get('date'))
+        self.subject.append(msg.get('subject', ''))
+        self.in_reply_to.append(msg.get('in-reply-to'))
+        self.references.append(msg.get('references'))
+        self.message_id.append(msg.get('message-id', msg.get('message_id', '')))
+        self.body.append(msg.get('body'))
+        self.attachments.append(msg.get('attachments'))
+    
+    @classmethod
+    def from_dicts(cls, messages: Iterable[Dict[str, Any]]) -> 'MessageColumns':
+        """Build the columns from message dictionaries in a single pass."""
+        columns = cls()
+        for msg in messages:
+            columns.append(msg)
+        return columns
+    
+    def iter_dicts(self) -> Generator[Dict[str, Any], None, None]:
+        """Yield a lightweight dictionary per message for the hash functions."""
+        for subject, from_addr, date_str, message_id, body in zip(
+                self.subject, self.from_, self.date, self.message_id, self.body):
+            msg = {'subject': subject, 'from': from_addr, 'date': date_str,
+                   'message-id': message_id}
+            if body is not None:
+                msg['body'] = body
+            yield msg
+
+
+# Anything the analyze_* methods accept as their messages argument
+MessageSource = Union[Iterable[Dict[str, Any]], MessageColumns]
+
+
+class _SenderAccumulator:
+    """Collects sender statistics one message at a time."""
+    
+    def __init__(self):
+        # With pandas the headers are only collected here and counted in one
+        # vectorized pass by result()
+        self.from_headers = [] if _get_pandas() is not None else None
+        self.sender_counter = Counter()
+        self.domain_counter = Counter()
+    
+    def add(self, msg: Dict[str, Any]) -> None:
+        from_header = msg.get('from', '')
+        if not from_header:
+            return
+        
+        if self.from_headers is not None:
+            self.from_headers.append(from_header)
+            return
+        
+        # Extract email address from "Name <email@example.com>"
+        email_match = _FROM_RE.search(from_header)
+        if email_match:
+            email_addr = email_match.group(1).lower()
+        else:
+            email_addr = from_header.strip().lower()
+            
+        self.sender_counter[email_addr] += 1
+        
+        # Extract domain
+        if '@' in email_addr:
+            domain = email_addr.split('@')[-1]
+            self.domain_counter[domain] += 1
+    
+    def add_columns(self, columns: MessageColumns) -> None:
+        if self.from_headers is not None:
+            self.from_headers.extend(h for h in columns.from_ if h)
+            return
+        for from_header in columns.from_:
+            self.add({'from': from_header})
+    
+    def result(self) -> Dict[str, Any]:
+        if self.from_headers is not None:
+            return self._result_pandas()
+        
+        return {
+            'top_senders': self.sender_counter.most_common(20),
+            'top_domains': self.domain_counter.most_common(20),
+            'unique_senders': len(self.sender_counter),
+            'unique_domains': len(self.domain_counter)
+        }
+    
+    def _result_pandas(self) -> Dict[str, Any]:
+        pd = _get_pandas()
+        from_headers = pd.Series(self.from_headers, dtype=object).astype(str)
+        
+        # Extract email address from "Name <email@example.com>"
+        addresses = from_headers.str.extract(_FROM_RE, expand=False).str.lower()
+        addresses = addresses.fillna(from_headers.str.strip().str.lower())
+        
+        # Extract domain
+        with_domain = addresses[addresses.str.contains('@', regex=False)]
+        domains = with_domain.str.rsplit('@', n=1).str[-1]
+        
+        sender_counts = addresses.value_counts()
+        domain_counts = domains.value_counts()
+        
+        return {
+            'top_senders': [(k, int(v)) for k, v in sender_counts.head(20).items()],
+            'top_domains': [(k, int(v)) for k, v in domain_counts.head(20).items()],
+            'unique_senders': len(sender_counts),
+            'unique_domains': len(domain_counts)
+        }
+
+
+class _TimelineAccumulator:
+    """Collects timeline statistics one message at a time."""
+    
+    def __init__(self, logger: logging.Logger):
+        self.logger = logger
+        self.total_emails = 0
+        # With numpy only the epoch seconds are kept and aggregated by result()
+        self.timestamps = array('q') if _get_numpy() is not None else None
+        self.dates = []
+        self.hours = []
+        self.weekdays = []
+    
+    def add(self, msg: Dict[str, Any]) -> None:
+        self.total_emails += 1
+        self._add_date(msg.get('date'))
+    
+    def add_columns(self, columns: MessageColumns) -> None:
+        self.total_emails += len(columns)
+        for date_str in columns.date:
+            self._add_date(date_str)
+    
+    def _add_date(self, date_str: Optional[str]) -> None:
+        if not date_str:
+            return
+            
+        try:
+            # Try to parse the date
+            date_tuple = email.utils.parsedate_tz(date_str)
+            if not date_tuple:
+                return
+            
+            if self.timestamps is not None:
+                self.timestamps.append(email.utils.mktime_tz(date_tuple))
+            else:
+                dt = datetime.fromtimestamp(email.utils.mktime_tz(date_tuple))
+                self.dates.append(dt.date())
+                self.hours.append(dt.hour)
+                self.weekdays.append(dt.weekday())  # Monday is 0, Sunday is 6
+        except (TypeError, ValueError) as e:
+            self.logger.debug("Could not parse date: %s: %s", date_str, e)
+    
+    def result(self) -> Dict[str, Any]:
+        if self.timestamps is not None:
+            return self._result_numpy()
+        
+        dates = self.dates
+        
+        # Calculate statistics
+        if dates:
+            date_range = (min(dates), max(dates))
+            total_days = (max(dates) - min(dates)).days + 1
+            emails_per_day = len(dates) / total_days if total_days > 0 else 0
+        else:
+            date_range = (None, None)
+            emails_per_day = 0
+        
+        # One counting pass instead of scanning the weekdays once per day
+        weekday_counts = Counter(self.weekdays)
+        
+        return {
+            'date_range': date_range,
+            'emails_per_day': emails_per_day,
+            'hour_distribution': Counter(self.hours).most_common(),
+            'weekday_distribution': [(d, weekday_counts[d]) for d in range(7)],
+            'total_emails': self.total_emails
+        }
+    
+    def _result_numpy(self) -> Dict[str, Any]:
+        if not self.timestamps:
+            return {
+                'date_range': (None, None),
+                'emails_per_day': 0,
+                'hour_distribution': [],
+                'weekday_distribution': [(d, 0) for d in range(7)],
+                'total_emails': self.total_emails
+            }
+        
+        np = _get_numpy()
+        ts = np.frombuffer(self.timestamps, dtype=np.int64)
+        
+        # Shift to local wall-clock time like datetime.fromtimestamp does.
+        # The UTC offset is looked up once per distinct hour, not per message.
+        utc_hours, hour_index = np.unique(ts // 3600, return_inverse=True)
+        offsets = np.array([
+            _local_utc_offset(int(hour) * 3600) for hour in utc_hours
+        ], dtype=np.int64)
+        local_ts = ts + offsets[hour_index.ravel()]
+        
+        local_days = local_ts // 86400
+        hours = (local_ts % 86400) // 3600
+        weekdays = (local_days + 3) % 7  # 1970-01-01 was a Thursday; Monday is 0
+        
+        first_day = int(local_days.min())
+        last_day = int(local_days.max())
+        epoch = date(1970, 1, 1)
+        total_days = last_day - first_day + 1
+        
+        hour_counts = np.bincount(hours, minlength=24)
+        hour_order = np.argsort(-hour_counts, kind='stable')
+        weekday_counts = np.bincount(weekdays, minlength=7)
+        
+        return {
+            'date_range': (epoch + timedelta(days=first_day), epoch + timedelta(days=last_day)),
+            'emails_per_day': len(ts) / total_days,
+            'hour_distribution': [(int(h), int(hour_counts[h])) for h in hour_order if hour_counts[h]],
+            'weekday_distribution': [(d, int(c)) for d, c in enumerate(weekday_counts)],
+            'total_emails': self.total_emails
+        }
+
+
+class _AttachmentAccumulator:
+    """Collects attachment statistics one message at a time."""
+    
+    def __init__(self):
+        self.attachment_types = Counter()
+        self.attachment_sizes = []
+        self.emails_with_attachments = 0
+    
+    def add(self, msg: Dict[str, Any]) -> None:
+        if 'attachments' in msg:
+            self._add_attachments(msg['attachments'])
+    
+    def add_columns(self, columns: MessageColumns) -> None:
+        for attachments in columns.attachments:
+            if attachments is not None:
+                self._add_attachments(attachments)
+    
+    def _add_attachments(self, attachments: List[Dict[str, Any]]) -> None:
+        if not attachments:
+            return
+        
+        self.emails_with_attachments += 1
+        # File extensions and sizes are added in bulk rather than one by one
+        self.attachment_types.update(
+            os.path.splitext(att.get('filename', 'unknown'))[1].lower() or '.unknown'
+            for att in attachments
+        )
+        self.attachment_sizes.extend(
+            size for size in (att.get('size', 0) for att in attachments) if size
+        )
+    
+    def result(self) -> Dict[str, Any]:
+        return {
+            'attachment_types': self.attachment_types.most_common(),
+            'total_attachments': sum(self.attachment_types.values()),
+            'emails_with_attachments': self.emails_with_attachments,
+            'attachment_size_stats': _calculate_stats(self.attachment_sizes) if self.attachment_sizes else {}
+        }
+
+
+class _ThreadAccumulator:
+    """Collects thread statistics one message at a time."""
+    
+    def __init__(self):
+        # Only the size of each thread is needed, not its messages
+        self.threads = Counter()
+    
+    def add(self, msg: Dict[str, Any]) -> None:
+        self._add_thread(msg.get('in-reply-to'), msg.get('references'),
+                         msg.get('subject', ''))
+    
+    def add_columns(self, columns: MessageColumns) -> None:
+        for fields in zip(columns.in_reply_to, columns.references, columns.subject):
+            self._add_thread(*fields)
+    
+    def _add_thread(self, in_reply_to: Optional[str], references: Optional[str],
+                    subject: str) -> None:
+        # Use In-Reply-To or References header to group messages into threads
+        thread_id = in_reply_to
+        if not thread_id:
+            if references:
+                # Only the first reference is needed, so split off just that one
+                first_reference = references.split(None, 1)
+                thread_id = first_reference[0] if first_reference else None
+        
+        if not thread_id:
+            # If no thread ID, use subject as a fallback
+            subject = subject.lower()
+            # Clean subject (remove Re:, Fwd:, etc.)
+            clean_subject = _SUBJ_RE.sub('', subject).strip()
+            thread_id = f'subject:{clean_subject}'
+        
+        self.threads[thread_id] += 1
+    
+    def result(self) -> Dict[str, Any]:
+        # Calculate thread statistics
+        thread_sizes = list(self.threads.values())
+        
+        return {
+            'total_threads': len(self.threads),
+            'thread_size_stats': _calculate_stats(thread_sizes) if thread_sizes else {},
+            'largest_thread': max(thread_sizes) if thread_sizes else 0
+        }
+
+
+class _DuplicateAccumulator:
+    """Counts messages per duplicate hash one message at a time."""
+    
+    def __init__(self, hash_message: Callable[[Dict[str, Any]], Optional[str]],
+                 hash_row: Callable[[Dict[str, Any]], Optional[str]]):
+        # hash_row is used for the throwaway dictionaries built from columns,
+        # which are not worth caching
+        self.hash_message = hash_message
+        self.hash_row = hash_row
+        self.hash_groups = Counter()
+    
+    def add(self, msg: Dict[str, Any]) -> None:
+        msg_hash = self.hash_message(msg)
+        if msg_hash is not None:
+            self.hash_groups[msg_hash] += 1
+    
+    def add_columns(self, columns: MessageColumns) -> None:
+        for msg in columns.iter_dicts():
+            msg_hash = self.hash_row(msg)
+            if msg_hash is not None:
+                self.hash_groups[msg_hash] += 1
+    
+    def result(self) -> Dict[str, Any]:
+        # Find duplicates (groups with more than one message)
+        duplicates = {h: count for h, count in self.hash_groups.items() if count > 1}
+        
+        return {
+            'total_duplicates': sum(count - 1 for count in duplicates.values()),
+            'duplicate_groups': len(duplicates),
+            'duplicate_sources': duplicates
+        }
 
-try:
-    import matplotlib.pyplot as plt
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
 
 class EmailAnalyzer:
     """Class for performing advanced email analysis."""
@@ -45,173 +471,67 @@ class EmailAnalyzer:
         self.duplicate_finder = duplicate_finder
         self.logger = logging.getLogger(__name__)
         self.analysis_results = {}
+        # Caches keyed by id() of the message dict; the dict itself is kept in
+        # the entry so a recycled id can never return a stale value. They only
+        # live for one analysis pass so streamed messages are not pinned.
+        self._hash_cache: Dict[Tuple[int, str], Tuple[Dict[str, Any], str]] = {}
+        self._email_cache: Dict[int, Tuple[Dict[str, Any], Optional[email.message.Message]]] = {}
     
-    def analyze_senders(self, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def clear_cache(self) -> None:
+        """Drop cached message hashes and converted messages."""
+        self._hash_cache.clear()
+        self._email_cache.clear()
+    
+    def analyze_senders(self, messages: MessageSource) -> Dict[str, Any]:
         """Analyze email senders.
         
         Args:
-            messages: List of email message dictionaries
+            messages: Iterable of email message dictionaries or a MessageColumns
             
         Returns:
             Dictionary with sender analysis results
         """
-        sender_counter = Counter()
-        domain_counter = Counter()
-        
-        for msg in messages:
-            from_header = msg.get('from', '')
-            if not from_header:
-                continue
-                
-            # Extract email address from "Name <email@example.com>"
-            email_match = re.search(r'<([^>]+)>', from_header)
-            if email_match:
-                email_addr = email_match.group(1).lower()
-            else:
-                email_addr = from_header.strip().lower()
-                
-            sender_counter[email_addr] += 1
-            
-            # Extract domain
-            if '@' in email_addr:
-                domain = email_addr.split('@')[-1]
-                domain_counter[domain] += 1
-        
-        return {
-            'top_senders': sender_counter.most_common(20),
-            'top_domains': domain_counter.most_common(20),
-            'unique_senders': len(sender_counter),
-            'unique_domains': len(domain_counter)
-        }
+        return self._run_accumulators(messages, sender=_SenderAccumulator())['sender']
     
-    def analyze_timeline(self, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def analyze_timeline(self, messages: MessageSource) -> Dict[str, Any]:
         """Analyze email timeline.
         
         Args:
-            messages: List of email message dictionaries
+            messages: Iterable of email message dictionaries or a MessageColumns
             
         Returns:
             Dictionary with timeline analysis results
         """
-        dates = []
-        hours = []
-        weekdays = []
-        
-        for msg in messages:
-            date_str = msg.get('date')
-            if not date_str:
-                continue
-                
-            try:
-                # Try to parse the date
-                date_tuple = email.utils.parsedate_tz(date_str)
-                if date_tuple:
-                    dt = datetime.fromtimestamp(email.utils.mktime_tz(date_tuple))
-                    dates.append(dt.date())
-                    hours.append(dt.hour)
-                    weekdays.append(dt.weekday())  # Monday is 0, Sunday is 6
-            except (TypeError, ValueError) as e:
-                self.logger.debug(f"Could not parse date: {date_str}: {e}")
-                continue
-        
-        # Calculate statistics
-        if dates:
-            date_range = (min(dates), max(dates))
-            total_days = (max(dates) - min(dates)).days + 1
-            emails_per_day = len(dates) / total_days if total_days > 0 else 0
-        else:
-            date_range = (None, None)
-            emails_per_day = 0
-        
-        return {
-            'date_range': date_range,
-            'emails_per_day': emails_per_day,
-            'hour_distribution': Counter(hours).most_common(),
-            'weekday_distribution': [(d, c) for d, c in enumerate(
-                [sum(1 for wd in weekdays if wd == i) for i in range(7)]
-            )],
-            'total_emails': len(messages)
-        }
+        return self._run_accumulators(messages, timeline=_TimelineAccumulator(self.logger))['timeline']
     
-    def analyze_attachments(self, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def analyze_attachments(self, messages: MessageSource) -> Dict[str, Any]:
         """Analyze email attachments.
         
         Args:
-            messages: List of email message dictionaries
+            messages: Iterable of email message dictionaries or a MessageColumns
             
         Returns:
             Dictionary with attachment analysis results
         """
-        attachment_types = Counter()
-        attachment_sizes = []
-        emails_with_attachments = 0
-        
-        for msg in messages:
-            has_attachments = False
-            
-            # Check for attachments in the email
-            if 'attachments' in msg:
-                for att in msg['attachments']:
-                    has_attachments = True
-                    # Get file extension
-                    filename = att.get('filename', 'unknown')
-                    ext = os.path.splitext(filename)[1].lower() or '.unknown'
-                    attachment_types[ext] += 1
-                    
-                    # Get size if available
-                    size = att.get('size', 0)
-                    if size:
-                        attachment_sizes.append(size)
-            
-            if has_attachments:
-                emails_with_attachments += 1
-        
-        return {
-            'attachment_types': attachment_types.most_common(),
-            'total_attachments': sum(attachment_types.values()),
-            'emails_with_attachments': emails_with_attachments,
-            'attachment_size_stats': self._calculate_stats(attachment_sizes) if attachment_sizes else {}
-        }
+        return self._run_accumulators(messages, attachments=_AttachmentAccumulator())['attachments']
     
-    def analyze_threads(self, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def analyze_threads(self, messages: MessageSource) -> Dict[str, Any]:
         """Analyze email threads and conversations.
         
         Args:
-            messages: List of email message dictionaries
+            messages: Iterable of email message dictionaries or a MessageColumns
             
         Returns:
             Dictionary with thread analysis results
         """
-        threads = defaultdict(list)
-        
-        for msg in messages:
-            # Use In-Reply-To or References header to group messages into threads
-            thread_id = msg.get('in-reply-to') or msg.get('references', '').split()[0] if msg.get('references') else None
-            
-            if not thread_id:
-                # If no thread ID, use subject as a fallback
-                subject = msg.get('subject', '').lower()
-                # Clean subject (remove Re:, Fwd:, etc.)
-                clean_subject = re.sub(r'^\s*(re|fwd?):\s*', '', subject).strip()
-                thread_id = f'subject:{clean_subject}'
-            
-            threads[thread_id].append(msg)
-        
-        # Calculate thread statistics
-        thread_sizes = [len(msgs) for msgs in threads.values()]
-        
-        return {
-            'total_threads': len(threads),
-            'thread_size_stats': self._calculate_stats(thread_sizes) if thread_sizes else {},
-            'largest_thread': max(thread_sizes) if thread_sizes else 0
-        }
+        return self._run_accumulators(messages, threads=_ThreadAccumulator())['threads']
     
-    def analyze_duplicates(self, messages: List[Dict[str, Any]], 
+    def analyze_duplicates(self, messages: MessageSource, 
                           hash_method: str = 'strict') -> Dict[str, Any]:
         """Analyze duplicate emails.
         
         Args:
-            messages: List of email message dictionaries
+            messages: Iterable of email message dictionaries or a MessageColumns
             hash_method: Method to use for detecting duplicates
                 'strict': Message-ID + Date + From + Subject + Body hash
                 'content': Body hash only
@@ -223,24 +543,105 @@ class EmailAnalyzer:
         """
         if not self.duplicate_finder:
             return {'error': 'Duplicate finder not initialized'}
+        
+        accumulator = self._duplicate_accumulator(hash_method)
+        return self._run_accumulators(messages, duplicates=accumulator)['duplicates']
+    
+    def analyze_all(self, messages: MessageSource,
+                    hash_method: str = 'strict') -> Dict[str, Any]:
+        """Run every analysis in a single pass over the messages.
+        
+        Unlike calling each analyze_* method in turn, the messages are only
+        iterated once, so a generator can be passed without materializing
+        the whole mailbox in memory.
+        
+        Args:
+            messages: Iterable of email message dictionaries or a MessageColumns
+            hash_method: Method to use for detecting duplicates
             
-        # Group messages by their hash
-        hash_groups = defaultdict(list)
+        Returns:
+            Dictionary with the results of each analysis plus 'total_emails'
+        """
+        accumulators = {
+            'senders': _SenderAccumulator(),
+            'timeline': _TimelineAccumulator(self.logger),
+            'attachments': _AttachmentAccumulator(),
+            'threads': _ThreadAccumulator()
+        }
+        if self.duplicate_finder:
+            accumulators['duplicates'] = self._duplicate_accumulator(hash_method)
         
-        for msg in messages:
+        results = self._run_accumulators(messages, **accumulators)
+        if not self.duplicate_finder:
+            results['duplicates'] = {'error': 'Duplicate finder not initialized'}
+        results['total_emails'] = accumulators['timeline'].total_emails
+        return results
+    
+    def _duplicate_accumulator(self, hash_method: str) -> _DuplicateAccumulator:
+        """Create a duplicate accumulator hashing with the given method."""
+        return _DuplicateAccumulator(
+            lambda msg: self._cached_hash(msg, hash_method),
+            lambda msg: self._compute_hash(msg, hash_method)
+        )
+    
+    def _run_accumulators(self, messages: MessageSource,
+                          **accumulators) -> Dict[str, Any]:
+        """Feed every message to each accumulator once and collect the results."""
+        try:
+            if isinstance(messages, MessageColumns):
+                for acc in accumulators.values():
+                    acc.add_columns(messages)
+            else:
+                add_functions = [acc.add for acc in accumulators.values()]
+                for msg in messages:
+                    for add in add_functions:
+                        add(msg)
+        finally:
+            self.clear_cache()
+        
+        return {name: acc.result() for name, acc in accumulators.items()}
+    
+    def _cached_hash(self, msg: Dict[str, Any], hash_method: str) -> Optional[str]:
+        """Return the hash of a message dict, reusing earlier results."""
+        key = (id(msg), hash_method)
+        cached = self._hash_cache.get(key)
+        if cached is not None and cached[0] is msg:
+            return cached[1]
+        
+        if self._hash_from_dict() is not None:
+            msg_hash = self._compute_hash(msg, hash_method)
+            self._hash_cache[key] = (msg, msg_hash)
+            return msg_hash
+        
+        cached_email = self._email_cache.get(id(msg))
+        if cached_email is not None and cached_email[0] is msg:
+            email_msg = cached_email[1]
+        else:
             email_msg = self._dict_to_email(msg)
-            if email_msg:
-                msg_hash = self.duplicate_finder.compute_email_hash(email_msg, hash_method)
-                hash_groups[msg_hash].append(msg)
+            self._email_cache[id(msg)] = (msg, email_msg)
         
-        # Find duplicates (groups with more than one message)
-        duplicates = {h: msgs for h, msgs in hash_groups.items() if len(msgs) > 1}
+        if not email_msg:
+            return None
         
-        return {
-            'total_duplicates': sum(len(msgs) - 1 for msgs in duplicates.values()),
-            'duplicate_groups': len(duplicates),
-            'duplicate_sources': {h: len(msgs) for h, msgs in duplicates.items()}
-        }
+        msg_hash = self.duplicate_finder.compute_email_hash(email_msg, hash_method)
+        self._hash_cache[key] = (msg, msg_hash)
+        return msg_hash
+    
+    def _hash_from_dict(self) -> Optional[Callable[[Dict[str, Any], str], str]]:
+        """Return the finder's dictionary hash function, if it has one."""
+        return getattr(self.duplicate_finder, 'compute_email_hash_from_dict', None)
+    
+    def _compute_hash(self, msg: Dict[str, Any], hash_method: str) -> Optional[str]:
+        """Hash a message dict without consulting or filling the caches."""
+        # Hash the dictionary fields directly when the finder supports it
+        hash_from_dict = self._hash_from_dict()
+        if hash_from_dict is not None:
+            return hash_from_dict(msg, hash_method)
+        
+        email_msg = self._dict_to_email(msg)
+        if not email_msg:
+            return None
+        return self.duplicate_finder.compute_email_hash(email_msg, hash_method)
     
     def _dict_to_email(self, msg_dict: Dict[str, Any]) -> Optional[email.message.Message]:
         """Convert a message dictionary back to an email.message.Message."""
@@ -260,70 +661,40 @@ class EmailAnalyzer:
     
     def _calculate_stats(self, values: List[float]) -> Dict[str, float]:
         """Calculate basic statistics for a list of numeric values."""
-        if not values:
-            return {}
-            
-        if PANDAS_AVAILABLE:
-            import pandas as pd
-            s = pd.Series(values)
-            return {
-                'count': len(values),
-                'mean': s.mean(),
-                'median': s.median(),
-                'min': s.min(),
-                'max': s.max(),
-                'std': s.std(),
-                '25%': s.quantile(0.25),
-                '50%': s.quantile(0.5),
-                '75%': s.quantile(0.75)
-            }
-        else:
-            # Fallback implementation without pandas
-            n = len(values)
-            if n == 0:
-                return {}
-                
-            sorted_values = sorted(values)
-            return {
-                'count': n,
-                'mean': sum(values) / n,
-                'median': sorted_values[n//2] if n % 2 == 1 else 
-                         (sorted_values[n//2 - 1] + sorted_values[n//2]) / 2,
-                'min': min(values),
-                'max': max(values)
-            }
+        return _calculate_stats(values)
     
-    def generate_report(self, messages: List[Dict[str, Any]], 
+    def generate_report(self, messages: MessageSource, 
                        include_plots: bool = False) -> Dict[str, Any]:
         """Generate a comprehensive email analysis report.
         
         Args:
-            messages: List of email message dictionaries
+            messages: Iterable of email message dictionaries (read only once)
+                or a MessageColumns
             include_plots: Whether to include matplotlib plots (requires matplotlib)
             
         Returns:
             Dictionary containing all analysis results
         """
+        analysis_timestamp = datetime.now().isoformat()
+        results = self.analyze_all(messages)
+        
         self.analysis_results = {
             'summary': {
-                'total_emails': len(messages),
-                'analysis_timestamp': datetime.now().isoformat()
+                'total_emails': results.pop('total_emails'),
+                'analysis_timestamp': analysis_timestamp
             },
-            'senders': self.analyze_senders(messages),
-            'timeline': self.analyze_timeline(messages),
-            'attachments': self.analyze_attachments(messages),
-            'threads': self.analyze_threads(messages),
-            'duplicates': self.analyze_duplicates(messages)
+            **results
         }
         
-        if include_plots and MATPLOTLIB_AVAILABLE:
+        if include_plots and _get_pyplot() is not None:
             self._generate_plots()
         
         return self.analysis_results
     
     def _generate_plots(self):
         """Generate matplotlib plots for the analysis."""
-        if not MATPLOTLIB_AVAILABLE or not self.analysis_results:
+        plt = _get_pyplot()
+        if plt is None or not self.analysis_results:
             return
             
         plots = {}
@@ -381,57 +752,67 @@ class EmailAnalyzer:
             
         output_format = output_format.lower()
         
+        # Each format is written straight to a text stream, so exporting to a
+        # file never holds the whole report in memory as one string
         if output_format == 'json':
             import json
-            content = json.dumps(self.analysis_results, indent=2, default=str)
+            def write_report(f: TextIO) -> None:
+                json.dump(self.analysis_results, f, indent=2, default=str)
             
-        elif output_format == 'csv' and PANDAS_AVAILABLE:
-            import pandas as pd
-            # Flatten the analysis results for CSV
-            flat_data = []
-            for section, data in self.analysis_results.items():
-                if section.startswith('_'):
-                    continue
-                if isinstance(data, dict):
-                    flat_data.append({'section': section, 'key': k, 'value': v} 
-                                    for k, v in data.items())
+        elif output_format == 'csv' and _get_pandas() is not None:
+            pd = _get_pandas()
+            # Flatten the analysis results for CSV into one list of rows
+            flat_rows = [
+                {'section': section, 'key': k, 'value': v}
+                for section, data in self.analysis_results.items()
+                if not section.startswith('_') and isinstance(data, dict)
+                for k, v in data.items()
+            ]
             
-            if flat_data:
-                df = pd.concat([pd.DataFrame(section) for section in flat_data], 
-                             ignore_index=True)
-                content = df.to_csv(index=False)
-            else:
-                content = "No tabular data to export to CSV"
+            def write_report(f: TextIO) -> None:
+                if flat_rows:
+                    pd.DataFrame(flat_rows, columns=['section', 'key', 'value']).to_csv(f, index=False)
+                else:
+                    f.write("No tabular data to export to CSV")
                 
         elif output_format == 'html':
-            # Simple HTML report
-            content = "<html><head><title>Email Analysis Report</title></head><body>"
-            content += f"<h1>Email Analysis Report</h1>"
-            content += f"<p>Generated on: {self.analysis_results['summary']['analysis_timestamp']}</p>"
+            if not output_file:
+                return ''.join(self._iter_html_report())
             
-            for section, data in self.analysis_results.items():
-                if section.startswith('_') or not data:
-                    continue
-                    
-                content += f"<h2>{section.title()}</h2>"
-                
-                if isinstance(data, dict):
-                    content += "<ul>"
-                    for k, v in data.items():
-                        if k != 'analysis_timestamp':
-                            content += f"<li><strong>{k}:</strong> {v}</li>"
-                    content += "</ul>"
-                else:
-                    content += f"<p>{data}</p>"
-            
-            content += "</body></html>"
+            def write_report(f: TextIO) -> None:
+                f.writelines(self._iter_html_report())
             
         else:
             return f"Unsupported output format: {output_format}"
         
         if output_file:
             with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+                write_report(f)
             return output_file
         else:
-            return content
+            buffer = io.StringIO()
+            write_report(buffer)
+            return buffer.getvalue()
+    
+    def _iter_html_report(self) -> Generator[str, None, None]:
+        """Yield the analysis results as fragments of a simple HTML report."""
+        yield "<html><head><title>Email Analysis Report</title></head><body>"
+        yield "<h1>Email Analysis Report</h1>"
+        yield f"<p>Generated on: {self.analysis_results['summary']['analysis_timestamp']}</p>"
+        
+        for section, data in self.analysis_results.items():
+            if section.startswith('_') or not data:
+                continue
+                
+            yield f"<h2>{section.title()}</h2>"
+            
+            if isinstance(data, dict):
+                yield "<ul>"
+                for k, v in data.items():
+                    if k != 'analysis_timestamp':
+                        yield f"<li><strong>{k}:</strong> {v}</li>"
+                yield "</ul>"
+            else:
+                yield f"<p>{data}</p>"
+        
+        yield "</body></html>"
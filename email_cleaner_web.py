@@ -13,6 +13,7 @@ import tempfile
 import shutil
 from flask import Flask, render_template, request, jsonify, redirect, url_for, session
 import logging
+from collections import deque
 from io import StringIO
 
 # Import the core functionality from the CLI version
@@ -23,14 +24,14 @@ from email_duplicate_cleaner import (
 )
 from struttura.help import get_help_content
 from db_init import (
-    create_app, init_db, add_scan_history, add_clean_record, 
+    get_app, init_db, add_scan_history, add_clean_record, 
     get_user_settings, update_user_settings, get_scan_history
 )
 from flask import redirect, url_for
 from models import ScanHistory, EmailCleanRecord, UserSettings
 
 # Create Flask app
-app = create_app()  # Use the app from db_init that has database setup
+app = get_app()  # Share the app from db_init that has database setup
 
 # Set up logging using the centralized logger
 from struttura.logger import logger as app_logger
@@ -1250,28 +1251,32 @@ document.addEventListener('DOMContentLoaded', () => {
     }
 });'''
 
+# Console writes kept for the web page; older ones are dropped so the
+# buffer (and every /status response) stays bounded on long runs
+MAX_CONSOLE_WRITES = 5000
+
 # Custom stream handler to capture console output
 class WebConsoleHandler:
     """Custom handler to capture console output for web display"""
 
     def __init__(self):
-        self.buffer = StringIO()
+        self.buffer = deque(maxlen=MAX_CONSOLE_WRITES)
 
     def write(self, message):
         if isinstance(message, bytes):
             message = message.decode('utf-8')
 
         if message and message.strip():  # Skip empty lines
-            self.buffer.write(message)
+            self.buffer.append(message)
 
     def flush(self):
         pass
 
     def get_logs(self):
-        return self.buffer.getvalue()
+        return "".join(self.buffer)
 
     def clear(self):
-        self.buffer = StringIO()
+        self.buffer.clear()
 
 # Initialize console handler
 console_handler = WebConsoleHandler()
@@ -0,0 +1,1139 @@
+"""
+Email Duplicate Cleaner - PySide6 main window
+
+This module contains the main window of the PySide6 GUI together with the
+thread pool workers and list models it uses. It is imported by
+email_cleaner_gui.main() once the splash screen is on screen.
+"""
+
+import os
+import sys
+import logging
+import mailbox
+import inspect
+from pathlib import Path
+from itertools import islice
+from typing import Optional, List, Dict, Any, Tuple
+
+from PySide6.QtWidgets import (
+    QButtonGroup, QComboBox, QDialog, QFileDialog, QGroupBox, QLabel,
+    QListView, QMainWindow, QMessageBox, QProgressBar,
+    QPushButton, QRadioButton, QSplitter, QStatusBar,
+    QTabWidget, QTextEdit, QVBoxLayout, QWidget
+)
+from PySide6.QtCore import (
+    QAbstractListModel, QModelIndex, QObject, QRunnable, QSettings,
+    Qt, QThreadPool, QTimer, QUrl, Signal
+)
+from PySide6.QtGui import QAction, QDesktopServices, QIcon
+
+# Add project root to the Python path
+project_root = Path(__file__).parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+# Initialize language manager
+from lang.lang_manager import language_manager, get_string
+
+def tr(key: str, **kwargs) -> str:
+    """Convenience function for translations (memoized by get_string)."""
+    return get_string(key, **kwargs)
+
+# Import application modules. The email engine and the dialogs behind menu
+# actions are imported where they are first used to keep startup fast.
+from struttura.menu import AppMenu
+from struttura.version import get_version_info
+from struttura.traceback_handler import setup_traceback_handler
+
+# Set up logging using the centralized logger
+from struttura.logger import logger as app_logger
+from struttura.logger import setup_logging
+
+# Initialize the logger with debug level
+logger = app_logger
+setup_logging(logging.DEBUG)
+
+# Log application startup
+logger.info("Application starting: python=%s cwd=%s path=%s", sys.version, os.getcwd(), sys.path)
+
+# Set up global exception handler
+setup_traceback_handler()
+
+# Number of folders posted to the folder list per UI update
+FOLDER_CHUNK_SIZE = 256
+
+# Delay before loading folders, so quickly stepping through clients only
+# loads the one the user stops on
+FOLDER_RELOAD_DELAY_MS = 150
+
+# Delay before the group preview follows the current row, so holding an
+# arrow key in the duplicates list only renders the group it stops on
+GROUP_PREVIEW_DELAY_MS = 120
+
+
+class WorkerSignals(QObject):
+    """Signals emitted by a Worker while it runs on the thread pool."""
+    
+    finished = Signal(object)  # Result returned by the task
+    progress = Signal(int)     # Percentage complete (0-100)
+    chunk = Signal(object)     # Partial result yielded by a generator task
+    error = Signal(str)        # Error message if the task raised
+
+
+class Worker(QRunnable):
+    """Run a blocking task on QThreadPool so the event loop stays responsive.
+    
+    The task is called with an extra ``progress`` keyword argument, a callable
+    taking a percentage. Progress is only emitted when the percentage changes,
+    so the progress bar is not repainted for every processed message.
+    
+    If the task is a generator, every yielded value is emitted through the
+    chunk signal as soon as it is produced and the generator's return value
+    becomes the finished result.
+    """
+    
+    def __init__(self, fn, *args, **kwargs):
+        """
+        Initialize the worker.
+        
+        Args:
+            fn: The callable to run in the worker thread
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+        """
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+        self._last_progress = -1
+    
+    def report_progress(self, percent: int):
+        """Emit the progress signal if the percentage has changed."""
+        if percent != self._last_progress:
+            self._last_progress = percent
+            self.signals.progress.emit(percent)
+    
+    def run(self):
+        """Run the task and emit finished or error."""
+        try:
+            result = self.fn(*self.args, progress=self.report_progress, **self.kwargs)
+            if inspect.isgenerator(result):
+                result = self._emit_chunks(result)
+        except Exception as e:
+            logger.error(f"Error in background task: {str(e)}", exc_info=True)
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+    
+    def _emit_chunks(self, chunks):
+        """Emit each value of a generator and return its return value."""
+        while True:
+            try:
+                self.signals.chunk.emit(next(chunks))
+            except StopIteration as stop:
+                return stop.value
+
+
+class DuplicateGroupsModel(QAbstractListModel):
+    """List model exposing the duplicate groups of a scan to a QListView.
+    
+    The groups are kept in a plain list and only the rows the view actually
+    paints are formatted, so loading thousands of groups is a single reset.
+    """
+    
+    def __init__(self, parent=None):
+        """Initialize an empty model."""
+        super().__init__(parent)
+        self._groups = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of duplicate groups."""
+        return 0 if parent.isValid() else len(self._groups)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Return the summary (DisplayRole) or the group itself (UserRole)."""
+        if not index.isValid():
+            return None
+        
+        group = self._groups[index.row()]
+        if role == Qt.DisplayRole:
+            return f"{group['messages'][0]['subject']} ({group['count']} duplicates)"
+        if role == Qt.UserRole:
+            return group
+        return None
+    
+    def setGroups(self, groups):
+        """Replace all groups in one model reset."""
+        self.beginResetModel()
+        self._groups = list(groups)
+        self.endResetModel()
+
+class FolderListModel(QAbstractListModel):
+    """List model of folder names that grows one loaded chunk at a time.
+    
+    appendNames() inserts a whole chunk with a single rowsInserted
+    notification, instead of rebuilding and resetting the full list of
+    names for every chunk the folder loader delivers.
+    """
+    
+    def __init__(self, parent=None):
+        """Initialize an empty model."""
+        super().__init__(parent)
+        self._names = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of folder names."""
+        return 0 if parent.isValid() else len(self._names)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Return the folder name for DisplayRole."""
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        return self._names[index.row()]
+    
+    def setNames(self, names):
+        """Replace all names in one model reset."""
+        self.beginResetModel()
+        self._names = list(names)
+        self.endResetModel()
+    
+    def appendNames(self, names):
+        """Append names at the end in one row insertion."""
+        if not names:
+            return
+        
+        first = len(self._names)
+        self.beginInsertRows(QModelIndex(), first, first + len(names) - 1)
+        self._names.extend(names)
+        self.endInsertRows()
+
+class EmailCleanerGUI(QMainWindow):
+    """Main application window for the Email Duplicate Cleaner."""
+    
+    def __init__(self):
+        """Initialize the main window."""
+        super().__init__()
+        
+        from email_duplicate_cleaner import EmailClientManager
+        
+        # Application state
+        self.email_manager = EmailClientManager()
+        self.current_folder = None
+        self.folders = []
+        self.duplicate_groups = []
+        self.duplicate_groups_model = DuplicateGroupsModel(self)
+        self.settings = QSettings("EmailDuplicateCleaner", "EmailDuplicateCleaner")
+        self._version_string = get_version_info()['full_version']
+        
+        # Log viewer
+        self.log_viewer = None
+        
+        # Debounced folder loading; the generation is bumped on every client
+        # change so folder loads still running for an old client stop early
+        self._folder_generation = 0
+        self._folder_reload_timer = QTimer(self)
+        self._folder_reload_timer.setSingleShot(True)
+        self._folder_reload_timer.setInterval(FOLDER_RELOAD_DELAY_MS)
+        self._folder_reload_timer.timeout.connect(self.load_folders)
+        
+        # Connect language change signal
+        language_manager.language_changed.connect(self.on_language_changed)
+        
+        # Initialize UI
+        self.init_ui()
+        
+        # Load settings
+        self.load_settings()
+        
+        # Check for updates after a short delay
+        QTimer.singleShot(1000, self.check_for_updates)
+    
+    def init_ui(self):
+        """Set up the user interface."""
+        self.setWindowTitle(f"Email Duplicate Cleaner {self._version_string}")
+        self.setMinimumSize(1024, 768)
+        
+        # Set application icon if available
+        icon_path = Path(__file__).parent / "icon.ico"
+        if icon_path.exists():
+            self.setWindowIcon(QIcon(str(icon_path)))
+        
+        # Create central widget and layout
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        
+        # Main layout
+        main_layout = QVBoxLayout(central_widget)
+        
+        # Create menu bar
+        self.create_menu_bar()
+        
+        # Create toolbar
+        self.create_toolbar()
+        
+        # Create main content area
+        content_splitter = QSplitter(Qt.Horizontal)
+        
+        # Left panel - Email clients and folders
+        left_panel = QWidget()
+        left_layout = QVBoxLayout(left_panel)
+        left_layout.setContentsMargins(0, 0, 0, 0)
+        
+        # Email clients list
+        self.client_combo = QComboBox()
+        self.client_combo.currentIndexChanged.connect(self.on_client_changed)
+        email_client_label = QLabel()
+        email_client_label.setObjectName("emailClientLabel")
+        left_layout.addWidget(email_client_label)
+        left_layout.addWidget(self.client_combo)
+        
+        # Folders list
+        self._folder_model = FolderListModel(self)
+        self.folder_list = QListView()
+        self.folder_list.setModel(self._folder_model)
+        self.folder_list.setUniformItemSizes(True)
+        self.folder_list.setLayoutMode(QListView.Batched)
+        self.folder_list.setBatchSize(100)
+        self.folder_list.setTextElideMode(Qt.ElideRight)
+        self.folder_list.clicked.connect(self.on_folder_selected)
+        self._folder_label = QLabel()
+        self._folder_label.setObjectName("folderLabel")
+        left_layout.addWidget(self._folder_label)
+        left_layout.addWidget(self.folder_list, 1)
+        
+        # Widgets relabelled by retranslate_ui, built once as (widget, key) pairs
+        self._translatable_texts = (
+            (self._folder_label, 'folders.label'),
+            (self._act_scan, 'actions.scan_folder'),
+            (self._act_analyze, 'actions.analyze'),
+            (self._act_clean_up, 'actions.clean_up'),
+        )
+        
+        # Add left panel to splitter
+        content_splitter.addWidget(left_panel)
+        
+        # Right panel - Main content
+        right_panel = QWidget()
+        right_layout = QVBoxLayout(right_panel)
+        
+        # Tabs start as empty pages and are filled in on first activation
+        self.tabs = QTabWidget()
+        
+        # Scan tab
+        self.scan_tab = QWidget()
+        self.tabs.addTab(self.scan_tab, tr('tabs.scan'))
+        
+        # Duplicates tab
+        self.duplicates_tab = QWidget()
+        self.tabs.addTab(self.duplicates_tab, tr('tabs.duplicates'))
+        
+        # Analysis tab
+        self.analysis_tab = QWidget()
+        self.tabs.addTab(self.analysis_tab, tr('tabs.analysis'))
+        
+        # Results tab
+        self.results_tab = QWidget()
+        self.tabs.addTab(self.results_tab, tr('tabs.results'))
+        
+        # Tools tab
+        self.tools_tab = QWidget()
+        self.tabs.addTab(self.tools_tab, tr('tabs.tools'))
+        
+        # Settings tab
+        self.settings_tab = QWidget()
+        self.tabs.addTab(self.settings_tab, tr('tabs.settings'))
+        
+        # Title keys in tab order, reapplied by retranslate_ui
+        self._tab_title_keys = (
+            'tabs.scan', 'tabs.duplicates', 'tabs.analysis',
+            'tabs.results', 'tabs.tools', 'tabs.settings'
+        )
+        
+        self._tab_builders = {
+            self.scan_tab: self.setup_scan_tab,
+            self.duplicates_tab: self.setup_duplicates_tab,
+            self.analysis_tab: self.setup_analysis_tab,
+            self.results_tab: self.setup_results_tab,
+            self.tools_tab: self.setup_tools_tab,
+            self.settings_tab: self.setup_settings_tab
+        }
+        
+        # Build the visible tab now so the first paint has content
+        self._ensure_tab_built(self.tabs.currentIndex())
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
+        
+        right_layout.addWidget(self.tabs)
+        
+        # Status bar
+        self.status_bar = QStatusBar()
+        self.setStatusBar(self.status_bar)
+        self.status_bar.showMessage("Ready")
+        
+        # Progress bar
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        self.status_bar.addPermanentWidget(self.progress_bar)
+        
+        # Add right panel to splitter
+        content_splitter.addWidget(right_panel)
+        
+        # Set initial sizes
+        content_splitter.setSizes([300, 700])
+        
+        # Add splitter to main layout
+        main_layout.addWidget(content_splitter)
+        
+        # Load email clients
+        self.load_email_clients()
+    
+    def _ensure_tab_built(self, index):
+        """Build the contents of the tab at index if not done yet."""
+        builder = self._tab_builders.pop(self.tabs.widget(index), None)
+        if builder:
+            builder()
+    
+    def _is_tab_built(self, tab):
+        """Return True if the given tab page has been built."""
+        return tab not in self._tab_builders
+    
+    def on_open_folder(self):
+        """Handle open folder action."""
+        folder = QFileDialog.getExistingDirectory(
+            self,
+            "Select Folder",
+            "",
+            QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks
+        )
+        
+        if folder:
+            self.current_folder = folder
+            self.status_bar.showMessage(f"Selected folder: {folder}")
+    
+    def create_menu_bar(self):
+        """Create the menu bar using the AppMenu class."""
+        # Create the AppMenu instance
+        self.app_menu = AppMenu(self)
+        self.setMenuBar(self.app_menu.menu_bar)
+        
+        # Connect menu signals to our methods
+        self.app_menu.open_folder_triggered.connect(self.on_open_folder)
+        self.app_menu.show_help_triggered.connect(self.show_help)
+        self.app_menu.show_about_triggered.connect(self.show_about)
+        self.app_menu.show_sponsor_triggered.connect(self.show_sponsor)
+        self.app_menu.exit_triggered.connect(self.close)
+        
+        # Connect language selection signal
+        self.app_menu.language_selected.connect(language_manager.set_language)
+        
+        # Set initial language in the menu
+        current_lang = language_manager.get_language()
+        for action in self.app_menu.language_group.actions():
+            if action.data() == current_lang:
+                action.setChecked(True)
+                break
+        
+        # Only connect debug and dark mode toggles if the methods exist
+        if hasattr(self, 'set_debug_mode'):
+            self.app_menu.debug_mode_toggled.connect(self.set_debug_mode)
+            self.app_menu.debug_action.setChecked(False)  # Or get from settings
+            
+        if hasattr(self, 'toggle_dark_mode'):
+            self.app_menu.dark_mode_toggled.connect(self.toggle_dark_mode)
+            self.app_menu.dark_mode_action.setChecked(False)  # Or get from settings
+        
+        # Connect to the open_log_viewer_triggered signal if the method exists
+        if hasattr(self, 'open_log_viewer'):
+            self.app_menu.open_log_viewer_triggered.connect(self.open_log_viewer)
+            
+        # Add check for updates action to the help menu
+        check_updates_action = QAction("Check for &Updates...", self)
+        check_updates_action.triggered.connect(self.check_for_updates)
+        self.app_menu.help_menu.addAction(check_updates_action)
+    
+    def create_toolbar(self):
+        """Create the toolbar."""
+        self.toolbar = self.addToolBar("Tools")
+        self.toolbar.setObjectName("mainToolbar")  # Set object name for state saving
+        
+        # Add actions, keeping them so retranslate_ui can relabel them directly
+        self._act_scan = self.toolbar.addAction("Scan Folder")
+        self._act_scan.triggered.connect(self.on_scan_folder)
+        self.toolbar.addSeparator()
+        self._act_analyze = self.toolbar.addAction("Analyze")
+        self._act_analyze.triggered.connect(self.on_analyze)
+        self._act_clean_up = self.toolbar.addAction("Clean Up")
+        self._act_clean_up.triggered.connect(self.on_clean_up)
+        
+        # Add toolbar toggle action
+        self.toolbar_toggle = QAction("Show Toolbar", self)
+        self.toolbar_toggle.setCheckable(True)
+        self.toolbar_toggle.setChecked(True)
+        self.toolbar_toggle.triggered.connect(
+            lambda checked: self.toolbar.setVisible(checked)
+        )
+    
+    def setup_scan_tab(self):
+        """Set up the scan tab."""
+        layout = QVBoxLayout(self.scan_tab)
+        
+        # Add scan tab content here
+        scan_label = QLabel(tr('scan_description'))
+        scan_label.setWordWrap(True)
+        layout.addWidget(scan_label)
+        
+        # Add scan button
+        scan_button = QPushButton(tr('scan_button'))
+        scan_button.clicked.connect(self.on_scan_folder)
+        layout.addWidget(scan_button)
+        
+        # Add stretch to push content to the top
+        layout.addStretch()
+    
+    def setup_duplicates_tab(self):
+        """Set up the duplicates tab."""
+        layout = QVBoxLayout(self.duplicates_tab)
+        
+        # Add duplicates tab content here
+        duplicates_label = QLabel(tr('tabs.duplicates'))
+        layout.addWidget(duplicates_label)
+        
+        # Add stretch to push content to the top
+        layout.addStretch()
+        
+        # Duplicate groups list
+        self.duplicate_groups_list = QListView()
+        self.duplicate_groups_list.setUniformItemSizes(True)
+        self.duplicate_groups_list.setLayoutMode(QListView.Batched)
+        self.duplicate_groups_list.setBatchSize(100)
+        self.duplicate_groups_list.setTextElideMode(Qt.ElideRight)
+        self.duplicate_groups_list.setModel(self.duplicate_groups_model)
+        
+        self._group_preview_timer = QTimer(self)
+        self._group_preview_timer.setSingleShot(True)
+        self._group_preview_timer.setInterval(GROUP_PREVIEW_DELAY_MS)
+        self._group_preview_timer.timeout.connect(self.on_duplicate_group_selected)
+        self.duplicate_groups_list.selectionModel().currentChanged.connect(
+            lambda current, previous: self._group_preview_timer.start()  # Restarts if already pending
+        )
+        
+        # Email preview
+        self.email_preview = QTextEdit()
+        self.email_preview.setReadOnly(True)
+        
+        # Splitter for duplicates and preview
+        splitter = QSplitter(Qt.Vertical)
+        splitter.addWidget(self.duplicate_groups_list)
+        splitter.addWidget(self.email_preview)
+        splitter.setSizes([300, 200])
+        
+        layout.addWidget(splitter)
+    
+    def setup_analysis_tab(self):
+        """Set up the analysis tab."""
+        layout = QVBoxLayout(self.analysis_tab)
+        
+        # Add analysis tab content here
+        analysis_label = QLabel(tr('tabs.analysis'))
+        layout.addWidget(analysis_label)
+        
+        # Add stretch to push content to the top
+        layout.addStretch()
+    
+    def setup_results_tab(self):
+        """Set up the results tab."""
+        layout = QVBoxLayout(self.results_tab)
+        
+        # Add results tab content here
+        results_label = QLabel(tr('tabs.results'))
+        layout.addWidget(results_label)
+        
+        # Add stretch to push content to the top
+        layout.addStretch()
+    
+    def setup_tools_tab(self):
+        """Set up the tools tab."""
+        layout = QVBoxLayout(self.tools_tab)
+        
+        # Add tools tab content here
+        tools_label = QLabel(tr('tabs.tools'))
+        layout.addWidget(tools_label)
+        
+        # Add stretch to push content to the top
+        layout.addStretch()
+    
+    def setup_settings_tab(self):
+        """Set up the settings tab."""
+        layout = QVBoxLayout(self.settings_tab)
+        
+        # Add settings tab content here
+        settings_label = QLabel(tr('tabs.settings'))
+        layout.addWidget(settings_label)
+        
+        # Add language selection
+        lang_group = QGroupBox(tr('menu_settings_language'))
+        lang_layout = QVBoxLayout()
+        
+        # English radio button
+        self.en_radio = QRadioButton(tr('menu_settings_language_en'))
+        lang_layout.addWidget(self.en_radio)
+        
+        # Italian radio button
+        self.it_radio = QRadioButton(tr('menu_settings_language_it'))
+        lang_layout.addWidget(self.it_radio)
+        
+        # One group for all language buttons, so a switch is handled once
+        self.language_buttons = QButtonGroup(self)
+        self._language_codes = {self.en_radio: 'en', self.it_radio: 'it'}
+        for button in self._language_codes:
+            self.language_buttons.addButton(button)
+        
+        # Set current language
+        current_lang = language_manager.get_language()
+        if current_lang == 'it':
+            self.it_radio.setChecked(True)
+        else:
+            self.en_radio.setChecked(True)
+        
+        self.language_buttons.buttonToggled.connect(self.on_language_button_toggled)
+        
+        lang_group.setLayout(lang_layout)
+        layout.addWidget(lang_group)
+        
+        # Add stretch to push content to the top
+        layout.addStretch()
+        # Analysis results
+        self.analysis_results = QTextEdit()
+        self.analysis_results.setReadOnly(True)
+        
+        layout.addWidget(QLabel("Analysis Results:"))
+        layout.addWidget(self.analysis_results, 1)
+    
+    def load_email_clients(self):
+        """Load available email clients."""
+        self.client_combo.clear()
+        
+        # Add supported email clients
+        self.client_combo.addItem(tr('email_client.select'), None)
+        self.client_combo.addItem(tr('email_client.thunderbird'), "thunderbird")
+        self.client_combo.addItem(tr('email_client.apple_mail'), "apple_mail")
+        self.client_combo.addItem(tr('email_client.outlook'), "outlook")
+        self.client_combo.addItem(tr('email_client.generic'), "generic")
+    
+    def on_client_changed(self, index):
+        """Handle email client selection change."""
+        self._folder_generation += 1
+        self.folders = []
+        
+        client_id = self.client_combo.currentData()
+        if not client_id:
+            self._folder_reload_timer.stop()
+            self._folder_model.setNames([])
+            return
+        
+        self._folder_model.setNames(["Loading folders..."])
+        self._folder_reload_timer.start()  # Restarts if already pending
+    
+    def load_folders(self):
+        """
+        Load folders for the selected email client on the thread pool.
+        
+        Folders are posted back in chunks, so the first ones are listed
+        while the rest of the profile is still being enumerated.
+        """
+        client_id = self.client_combo.currentData()
+        if not client_id:
+            return
+        
+        worker = Worker(self._iter_folders, client_id, self._folder_generation)
+        worker.signals.chunk.connect(self.on_folders_chunk)
+        worker.signals.finished.connect(self.on_folders_loaded)
+        worker.signals.error.connect(self.on_worker_error)
+        QThreadPool.globalInstance().start(worker)
+    
+    def _iter_folders(self, client_id, generation, progress):
+        """Yield (generation, folders) chunks (runs in a worker thread)."""
+        # Folders are batched as the handler discovers them, so the first
+        # chunk is posted before the rest of the profile has been walked
+        folders = self.email_manager.iter_client_folders(client_id)
+        while True:
+            if generation != self._folder_generation:
+                return None  # Superseded by a newer client selection
+            chunk = list(islice(folders, FOLDER_CHUNK_SIZE))
+            if not chunk:
+                return generation
+            yield generation, chunk
+    
+    def on_folders_chunk(self, chunk):
+        """Append a chunk of folders to the folder list."""
+        generation, folders = chunk
+        if generation != self._folder_generation:
+            return  # Stale chunk from a previous client selection
+        
+        names = [folder['display_name'] for folder in folders]
+        if self.folders:
+            self._folder_model.appendNames(names)
+        else:
+            # The first chunk replaces the loading placeholder
+            self._folder_model.setNames(names)
+        self.folders.extend(folders)
+    
+    def on_folders_loaded(self, generation):
+        """Handle the end of folder loading."""
+        if generation == self._folder_generation and not self.folders:
+            self._folder_model.setNames([])
+            self.status_bar.showMessage("No mail folders found")
+    
+    def on_folder_selected(self, index):
+        """Handle folder selection."""
+        row = index.row()
+        if row >= len(self.folders):
+            return
+        
+        self.current_folder = self.folders[row]
+        self.status_bar.showMessage(f"Selected folder: {self.current_folder['display_name']}")
+    
+    def _current_folder_info(self) -> Dict[str, Any]:
+        """Build the folder info dictionary expected by EmailClientManager."""
+        if isinstance(self.current_folder, dict):
+            return self.current_folder
+        return {
+            'path': self.current_folder,
+            'display_name': Path(self.current_folder).name or self.current_folder
+        }
+    
+    def _start_worker(self, fn, on_finished, *args):
+        """
+        Run a task on the global thread pool with a determinate progress bar.
+        
+        Args:
+            fn: Task to run; receives *args and a ``progress`` callback
+            on_finished: Slot called in the GUI thread with the task's result
+            *args: Arguments for the task
+        """
+        worker = Worker(fn, *args)
+        worker.signals.progress.connect(self.progress_bar.setValue)
+        worker.signals.finished.connect(on_finished)
+        worker.signals.error.connect(self.on_worker_error)
+        
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        
+        QThreadPool.globalInstance().start(worker)
+    
+    def on_worker_error(self, error):
+        """Handle a failed background task."""
+        self.progress_bar.setVisible(False)
+        self.status_bar.showMessage(f"Error: {error}")
+        QMessageBox.critical(self, tr('error_title'), error)
+    
+    def on_scan_folder(self):
+        """Handle scan folder action."""
+        if not self.current_folder:
+            QMessageBox.warning(self, "No Folder Selected", "Please select a folder to scan.")
+            return
+        
+        # Show progress
+        self.status_bar.showMessage(f"Scanning folder: {self._current_folder_info()['display_name']}...")
+        self._start_worker(self._scan_task, self.on_scan_complete, self._current_folder_info())
+    
+    def _scan_task(self, folder_info, progress):
+        """Scan a folder for duplicates (runs in a worker thread)."""
+        groups = self.email_manager.scan_folder(
+            folder_info,
+            hash_method='strict',
+            progress_callback=lambda done, total: progress(done * 100 // max(total, 1))
+        )
+        progress(100)
+        return groups
+    
+    def on_scan_complete(self, groups):
+        """Handle scan completion."""
+        self.progress_bar.setVisible(False)
+        self.status_bar.showMessage("Scan complete")
+        
+        self.duplicate_groups = groups
+        self.email_manager.duplicate_groups = groups
+        
+        # Show results
+        QMessageBox.information(
+            self,
+            "Scan Complete",
+            f"Found {len(groups)} duplicate email groups in {self._current_folder_info()['display_name']}."
+        )
+        
+        # Update UI with results
+        self.update_duplicates_list()
+    
+    def update_duplicates_list(self):
+        """Update the duplicates list with the groups from the last scan."""
+        self.duplicate_groups_model.setGroups(self.duplicate_groups)
+    
+    def on_duplicate_group_selected(self):
+        """Show the duplicate group the current row settled on."""
+        group = self.duplicate_groups_list.currentIndex().data(Qt.UserRole)
+        if not group:
+            return
+        
+        # Show the headers of every message in the group
+        messages = group['messages']
+        self.email_preview.setPlainText("\n\n".join(
+            f"From: {msg['from']}\nDate: {msg['date']}\nSubject: {msg['subject']}"
+            for msg in messages
+        ))
+    
+    def on_analyze(self):
+        """Handle analyze action."""
+        if not self.current_folder:
+            QMessageBox.warning(self, "No Folder Selected", "Please select a folder to analyze.")
+            return
+        
+        # Show progress
+        self.status_bar.showMessage(f"Analyzing folder: {self._current_folder_info()['display_name']}...")
+        self._start_worker(self._analyze_task, self.on_analysis_complete,
+                           self._current_folder_info(), list(self.duplicate_groups))
+    
+    def _analyze_task(self, folder_info, duplicate_groups, progress):
+        """
+        Read message headers and run the analyzer (runs in a worker thread).
+        
+        Returns:
+            Tuple of (analysis results, formatted report text)
+        """
+        from email_analyzer import MessageColumns
+        
+        columns = MessageColumns()
+        mbox = mailbox.mbox(folder_info['path'])
+        try:
+            total = len(mbox)
+            for i, message in enumerate(mbox):
+                columns.append({
+                    'from': message.get('From', ''),
+                    'date': message.get('Date'),
+                    'subject': message.get('Subject', ''),
+                    'in-reply-to': message.get('In-Reply-To'),
+                    'references': message.get('References'),
+                    'message-id': message.get('Message-ID', '')
+                })
+                if i % 100 == 0:
+                    progress(i * 100 // total)
+        finally:
+            mbox.close()
+        
+        results = self.email_manager.analyzer.generate_report(columns)
+        report = self._format_analysis_report(folder_info['display_name'], results, duplicate_groups)
+        progress(100)
+        return results, report
+    
+    @staticmethod
+    def _format_analysis_report(folder_name, results, duplicate_groups):
+        """Build the analysis report text in one pass, ready for a single setPlainText."""
+        lines = [
+            f"Analysis Results for '{folder_name}':",
+            "----------------------------------------",
+            f"Total emails: {results['summary']['total_emails']:,}",
+            f"Duplicate groups: {len(duplicate_groups)}",
+            "",
+            "Top senders:"
+        ]
+        for sender, count in results['senders'].get('top_senders', [])[:5]:
+            lines.append(f"- {sender} ({count} emails)")
+        
+        if duplicate_groups:
+            lines += ["", "Largest duplicate groups:"]
+            for group in duplicate_groups[:5]:
+                lines.append(f"- \"{group['messages'][0]['subject']}\" ({group['count']} duplicates)")
+        
+        return "\n".join(lines)
+    
+    def on_analysis_complete(self, result):
+        """Handle analysis completion."""
+        self.progress_bar.setVisible(False)
+        self.status_bar.showMessage("Analysis complete")
+        results, report = result
+        self.email_manager.analysis_results = results
+        
+        # Update analysis tab with results
+        self._ensure_tab_built(self.tabs.indexOf(self.settings_tab))
+        self.analysis_results.setPlainText(report)
+        
+        # Switch to analysis tab
+        self.tabs.setCurrentWidget(self.analysis_tab)
+    
+    def on_clean_up(self):
+        """Handle clean up action."""
+        if self.duplicate_groups_model.rowCount() == 0:
+            QMessageBox.information(
+                self,
+                "No Duplicates Found",
+                "No duplicate emails were found to clean up."
+            )
+            return
+        
+        # Show confirmation dialog
+        reply = QMessageBox.question(
+            self,
+            "Confirm Clean Up",
+            "This will remove all duplicate emails, keeping only the first occurrence "
+            "of each. This action cannot be undone.\n\n"
+            "Are you sure you want to continue?",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        
+        if reply == QMessageBox.Yes:
+            # Show progress
+            self.status_bar.showMessage("Cleaning up duplicates...")
+            self._start_worker(self._cleanup_task, self.on_cleanup_complete,
+                               list(range(len(self.duplicate_groups))))
+    
+    def _cleanup_task(self, group_indices, progress):
+        """Delete the duplicates of the given groups (runs in a worker thread)."""
+        result = self.email_manager.delete_duplicates(group_indices)
+        progress(100)
+        return result
+    
+    def on_cleanup_complete(self, result):
+        """Handle cleanup completion."""
+        self.progress_bar.setVisible(False)
+        self.status_bar.showMessage("Cleanup complete")
+        deleted_count, errors = result
+        
+        # Show results
+        message = f"Successfully removed {deleted_count} duplicate emails."
+        if errors:
+            message += "\n\nErrors:\n" + "\n".join(errors)
+        QMessageBox.information(self, "Cleanup Complete", message)
+        
+        # Refresh the UI
+        self.duplicate_groups = []
+        self.duplicate_groups_model.setGroups([])
+        if self._is_tab_built(self.duplicates_tab):
+            self.email_preview.clear()
+    
+    def toggle_toolbar(self, visible):
+        """Toggle toolbar visibility."""
+        self.toolbar.setVisible(visible)
+    
+    def show_sponsor(self):
+        """Show sponsor dialog."""
+        try:
+            from struttura.sponsor import SponsorDialog
+            
+            logger.debug("Creating SponsorDialog instance")
+            
+            # Create the dialog
+            sponsor_dialog = SponsorDialog(self)
+            
+            # Set window flags to ensure proper dialog behavior
+            sponsor_dialog.setWindowFlags(
+                Qt.Window | 
+                Qt.Dialog | 
+                Qt.WindowTitleHint | 
+                Qt.WindowCloseButtonHint |
+                Qt.WindowSystemMenuHint
+            )
+            
+            # Show the dialog modally
+            result = sponsor_dialog.exec()
+            logger.debug("SponsorDialog closed with result: %s", result)
+            
+        except ImportError as e:
+            logger.error(f"Import error in show_sponsor: {str(e)}")
+            QMessageBox.critical(
+                self,
+                "Import Error",
+                f"Failed to load required modules: {str(e)}\n\nPlease make sure all dependencies are installed."
+            )
+        except Exception as e:
+            logger.exception("Unexpected error in show_sponsor")
+            QMessageBox.critical(
+                self,
+                "Error",
+                f"An unexpected error occurred while showing the sponsor dialog.\n\n{str(e)}"
+            )
+    
+    def show_about(self):
+        """Show about dialog."""
+        from struttura.about import About
+        About.show_about(self)
+    
+    def show_help(self):
+        """Show help dialog."""
+        from struttura.help import Help
+        Help.show_help(self)
+        
+    def open_log_viewer(self):
+        """Open the log viewer dialog, or raise it if it is already open."""
+        if self.log_viewer:
+            self.log_viewer.raise_()
+            self.log_viewer.activateWindow()
+            return
+        
+        try:
+            from struttura.view_log import LogViewer
+            viewer = LogViewer(self)
+            
+            # Qt deletes the dialog when it closes; destroyed clears our reference
+            viewer.setAttribute(Qt.WA_DeleteOnClose)
+            viewer.destroyed.connect(self._forget_log_viewer)
+            self.log_viewer = viewer
+            
+            viewer.show()
+            viewer.raise_()
+            viewer.activateWindow()
+        except Exception as e:
+            logger.error(f"Error opening log viewer: {str(e)}", exc_info=True)
+            QMessageBox.critical(
+                self,
+                tr('error_title'),
+                f"Error opening log viewer: {str(e)}"
+            )
+    
+    def _forget_log_viewer(self, *args):
+        """Drop the log viewer reference once Qt has destroyed the dialog."""
+        self.log_viewer = None
+    
+    def check_for_updates(self):
+        """Check for application updates."""
+        self.status_bar.showMessage("Checking for updates...")
+        
+        # Get current version from the version module
+        from struttura.version import __version__
+        from struttura.updates import UpdateChecker
+        
+        # Create and configure the update checker
+        self.update_checker = UpdateChecker(current_version=__version__)
+        self.update_checker.update_available.connect(self.on_update_available)
+        self.update_checker.no_update_available.connect(self.on_no_update_available)
+        self.update_checker.check_failed.connect(self.on_update_check_failed)
+        
+        # Start the update check
+        self.update_checker.check_update()
+    
+    def on_update_available(self, release_info):
+        """Handle update available event."""
+        self.status_bar.showMessage("Update available!")
+        
+        # Show update dialog
+        from struttura.updates import UpdateDialog
+        dialog = UpdateDialog(release_info, self)
+        if dialog.exec_() == QDialog.Accepted:
+            # User chose to update
+            QDesktopServices.openUrl(QUrl(release_info['html_url']))
+    
+    def on_no_update_available(self):
+        """Handle no update available event."""
+        self.status_bar.showMessage("You have the latest version.", 3000)
+    
+    def on_update_check_failed(self, error):
+        """Handle update check failure."""
+        self.status_bar.showMessage(f"Update check failed: {error}", 5000)
+        QMessageBox.warning(
+            self,
+            "Update Check Failed",
+            f"Failed to check for updates: {error}"
+        )
+    
+    def load_settings(self):
+        """Load application settings."""
+        # Window geometry and state
+        self.settings.beginGroup("window")
+        geometry = self.settings.value("geometry")
+        if geometry:
+            self.restoreGeometry(geometry)
+        state = self.settings.value("state")
+        if state:
+            self.restoreState(state)
+        self.settings.endGroup()
+        
+        # Other settings
+        self.settings.beginGroup("ui")
+        toolbar_visible = self.settings.value("toolbar_visible", True, type=bool)
+        self.settings.endGroup()
+        if hasattr(self, 'toolbar_toggle'):
+            self.toolbar_toggle.setChecked(toolbar_visible)
+        if hasattr(self, 'toolbar'):
+            self.toolbar.setVisible(toolbar_visible)
+    
+    def save_settings(self):
+        """Save application settings."""
+        # Window geometry and state
+        self.settings.beginGroup("window")
+        self.settings.setValue("geometry", self.saveGeometry())
+        self.settings.setValue("state", self.saveState())
+        self.settings.endGroup()
+        
+        # Other settings
+        self.settings.beginGroup("ui")
+        self.settings.setValue("toolbar_visible", self.toolbar_toggle.isChecked())
+        self.settings.endGroup()
+        
+        # Flush all keys to storage in one write
+        self.settings.sync()
+    
+    def on_language_button_toggled(self, button, checked):
+        """Switch language when a language radio button becomes checked."""
+        if checked:
+            self.on_language_selected(self._language_codes[button])
+    
+    def on_language_selected(self, lang_code):
+        """Handle language selection from radio buttons."""
+        if lang_code != language_manager.get_language():
+            language_manager.set_language(lang_code)
+    
+    def on_language_changed(self, lang_code):
+        """Handle language change and update the UI."""
+        logger.info(f"Language changed to: {lang_code}")
+        try:
+            # Update the menu
+            if hasattr(self, 'app_menu'):
+                self.app_menu.set_language(lang_code)
+            
+            # Retranslate the UI
+            self.retranslate_ui()
+            
+            # Show status message
+            self.status_bar.showMessage(tr('status.language_changed').format(language=lang_code.upper()))
+            
+        except Exception as e:
+            logger.error(f"Error changing language: {str(e)}", exc_info=True)
+            self.status_bar.showMessage(tr('error.language_change_failed'))
+    
+    def retranslate_ui(self):
+        """Retranslate UI elements when language changes."""
+        try:
+            # Window title
+            self.setWindowTitle(tr('app.title').format(version=self._version_string))
+            
+            # Email client selection
+            if hasattr(self, 'client_combo') and self.client_combo.count() > 0:
+                self.client_combo.setItemText(0, tr('email_client.select'))
+            
+            # Tabs
+            if hasattr(self, 'tabs'):
+                for index, key in enumerate(self._tab_title_keys):
+                    self.tabs.setTabText(index, tr(key))
+            
+            # Folder label and toolbar actions
+            for widget, key in getattr(self, '_translatable_texts', ()):
+                widget.setText(tr(key))
+            
+            # Status bar
+            if hasattr(self, 'status_bar'):
+                self.status_bar.showMessage(tr('status.ready'))
+            
+            # Menu items
+            if hasattr(self, 'app_menu') and hasattr(self.app_menu, 'retranslate_ui'):
+                self.app_menu.retranslate_ui()
+                
+            logger.info("UI retranslated to: %s", language_manager.get_language())
+            
+        except Exception as e:
+            logger.error(f"Error retranslating UI: {str(e)}", exc_info=True)
+    
+    def closeEvent(self, event):
+        """Handle window close event."""
+        self.save_settings()
+        event.accept()
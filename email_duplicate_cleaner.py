@@ -18,6 +18,7 @@ import mailbox
 import hashlib
 import re
 import argparse
+import codecs
 import time
 import email
 import email.utils
@@ -25,10 +26,12 @@ import email.message
 import tempfile
 import shutil
 import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict
-from typing import Dict, List, Set, Tuple, Optional, Any, Union, Generator
+from collections import OrderedDict, defaultdict
+from typing import Dict, List, Set, Tuple, Optional, Any, Union, Generator, Callable, Iterator
 from email_analyzer import EmailAnalyzer
 
 # Try to import rich for enhanced UI
@@ -56,6 +59,27 @@ except ImportError:
     print("Rich library not found. Install with: pip install rich")
     print("Basic terminal output will be used instead.")
 
+# Prefer xxHash for duplicate keys when it is installed
+try:
+    import xxhash
+    XXHASH_AVAILABLE = hasattr(xxhash, 'xxh3_128')
+except ImportError:
+    xxhash = None
+    XXHASH_AVAILABLE = False
+
+
+def new_email_hasher():
+    """
+    Return a fresh hasher for duplicate detection keys.
+    
+    The keys only need to avoid accidental collisions, not resist attacks, so
+    xxHash (XXH3, 128 bit) is used when available and BLAKE2b otherwise. Both
+    are considerably faster than MD5 and keep a 128 bit digest.
+    """
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128()
+    return hashlib.blake2b(digest_size=16)
+
 # Constants for email client paths
 EMAIL_CLIENT_PATHS = {
     'thunderbird': [
@@ -79,6 +103,19 @@ EMAIL_CLIENT_PATHS = {
 # Email format types
 EMAIL_FORMAT_TYPES = ['mbox', 'maildir', 'pst', 'ost', 'emlx', 'eml']
 
+# Subdirectories that make a directory a Maildir folder
+MAILDIR_SUBDIRS = frozenset(('cur', 'new', 'tmp'))
+
+# Number of decoded messages get_email_content() keeps for repeat previews
+EMAIL_CACHE_SIZE = 64
+
+# Message-IDs of the messages create_test_mailbox() duplicates in demo mode
+DEMO_DUPLICATE_MESSAGE_IDS = (
+    '<team-meeting-duplicate@example.com>',
+    '<company-picnic-duplicate@example.com>',
+    '<weekly-report-duplicate@example.com>',
+)
+
 
 class BaseEmailClientHandler:
     """Base class for email client handlers."""
@@ -88,6 +125,8 @@ class BaseEmailClientHandler:
         self.profile_paths = []
         self.mail_folders = []
         self.client_name = "Generic"
+        # (directory, folder_name) -> (mtime_ns of every walked directory, mail files)
+        self._mail_file_cache = {}
         
     def find_profile_paths(self) -> List[str]:
         """Find profile directories on the system."""
@@ -97,19 +136,103 @@ class BaseEmailClientHandler:
         """Find mail folders in the profiles."""
         raise NotImplementedError("Subclasses must implement this method")
     
+    def iter_mail_folders(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the mail folders in the profiles.
+        
+        Handlers that can discover folders one at a time override this so
+        callers can show the first folders before the walk is finished.
+        """
+        return iter(self.find_mail_folders())
+    
     def _scan_for_mail_files(self, directory: str, folder_name: str) -> List[Dict[str, Any]]:
         """Scan directory for mail files (generic implementation)."""
-        mail_files = []
+        return list(self._iter_mail_files(directory, folder_name))
+    
+    def _iter_mail_files(self, directory: str, folder_name: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the mail files of a directory tree as they are found.
         
+        The tree is walked with os.scandir, whose entries already know
+        whether they are directories, so only mail candidates are stat()ed.
+        Directory mtimes for the walk cache come from the parent's listing
+        (DirEntry.stat(), which needs no extra system call on Windows)
+        rather than a separate os.stat() of every directory. A directory
+        holding cur/new/tmp is a Maildir: it is listed as one folder and its
+        message files are not walked. Hidden directories are only listed
+        when they are Maildir++ subfolders (e.g. ".Sent").
+        """
         # Check if directory exists to avoid errors
         if not os.path.exists(directory):
-            return mail_files
+            return
+        
+        # Reuse the last walk of this tree if none of its directories changed
+        cache_key = (directory, folder_name)
+        cached = self._mail_file_cache.get(cache_key)
+        if cached is not None and self._directories_unchanged(cached[0]):
+            for mail_file in cached[1]:
+                yield dict(mail_file)
+            return
+        
+        mail_files = []
+        dir_mtimes = {}
+        
+        try:
+            root_mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return
+        
+        # Looked up once instead of for every file in the tree
+        splitext = os.path.splitext
+        client_name = self.client_name
+        
+        # Stack of (path, path relative to directory, only-if-maildir flag,
+        # mtime from the parent's listing)
+        stack = [(directory, "", False, root_mtime)]
+        while stack:
+            current, rel_path, maildir_only, mtime = stack.pop()
             
-        # Generic scan for common mail file formats
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                file_path = os.path.join(root, file)
-                file_ext = os.path.splitext(file)[1].lower()
+            try:
+                with os.scandir(current) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            dir_mtimes[current] = mtime
+            
+            subdirs = []
+            files = []
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry)
+                    elif entry.is_file():
+                        files.append(entry)
+                except OSError:
+                    continue
+            
+            display_path = f"{folder_name}/{rel_path}" if rel_path else folder_name
+            
+            if MAILDIR_SUBDIRS.issubset(entry.name for entry in subdirs):
+                # Maildir: record the folder itself instead of its message files
+                mail_file = {
+                    'path': current,
+                    'display_name': display_path,
+                    'type': 'maildir',
+                    'client': client_name
+                }
+                mail_files.append(mail_file)
+                yield dict(mail_file)
+                
+                # Only Maildir++ subfolders (".Sent", ...) are worth descending into
+                subdirs = [entry for entry in subdirs if entry.name.startswith('.')]
+                files = []
+            elif maildir_only:
+                continue
+            
+            # Generic scan for common mail file formats
+            for entry in files:
+                file = entry.name
+                file_ext = splitext(file)[1].lower()
                 
                 # Skip known non-mail files
                 if file_ext in ['.html', '.txt', '.js', '.json', '.css']:
@@ -124,20 +247,68 @@ class BaseEmailClientHandler:
                 elif file_ext in ['.pst', '.ost']:
                     mail_type = 'pst' if file_ext == '.pst' else 'ost'
                 
-                if mail_type and os.path.getsize(file_path) > 0:
-                    rel_path = os.path.relpath(root, directory)
-                    display_path = folder_name
-                    if rel_path and rel_path != ".":
-                        display_path = f"{folder_name}/{rel_path}"
-                        
-                    mail_files.append({
-                        'path': file_path,
-                        'display_name': f"{display_path}/{file}",
-                        'type': mail_type,
-                        'client': self.client_name
-                    })
+                try:
+                    if not mail_type or entry.stat().st_size == 0:
+                        continue
+                except OSError:
+                    continue
                 
-        return mail_files
+                mail_file = {
+                    'path': entry.path,
+                    'display_name': f"{display_path}/{file}",
+                    'type': mail_type,
+                    'client': client_name
+                }
+                mail_files.append(mail_file)
+                yield dict(mail_file)
+            
+            # Push subdirectories in reverse so they are visited in listing order
+            for entry in reversed(subdirs):
+                try:
+                    # An mtime from before the child is listed can only make
+                    # the next cache check walk again, never miss a change
+                    child_mtime = entry.stat(follow_symlinks=False).st_mtime_ns
+                except OSError:
+                    continue
+                child_rel = os.path.join(rel_path, entry.name) if rel_path else entry.name
+                stack.append((entry.path, child_rel, entry.name.startswith('.'), child_mtime))
+        
+        # Only a walk that ran to the end is complete enough to be reused
+        self._mail_file_cache[cache_key] = (dir_mtimes, mail_files)
+    
+    @staticmethod
+    def _skip_maildir_subdirs(dirs: List[str]) -> None:
+        """
+        Keep os.walk() out of the cur/new/tmp directories of a Maildir.
+        
+        Their entries are single messages, never mail folders, so walking
+        them would only cost a stat() per message.
+        
+        Args:
+            dirs: Subdirectory names yielded by os.walk(), pruned in place
+        """
+        if MAILDIR_SUBDIRS.issubset(dirs):
+            dirs[:] = [name for name in dirs if name not in MAILDIR_SUBDIRS]
+    
+    @staticmethod
+    def _directories_unchanged(dir_mtimes: Dict[str, int]) -> bool:
+        """
+        Check whether the directories of a previous walk are unchanged.
+        
+        A directory's mtime changes whenever an entry is added to, removed
+        from or renamed in it, so equal mtimes mean the same tree shape.
+        
+        Args:
+            dir_mtimes: Mapping of directory path to its st_mtime_ns at walk time
+            
+        Returns:
+            True if every directory still exists with the same mtime
+        """
+        try:
+            return all(os.stat(path).st_mtime_ns == mtime
+                       for path, mtime in dir_mtimes.items())
+        except OSError:
+            return False
 
 
 class ThunderbirdMailHandler(BaseEmailClientHandler):
@@ -269,6 +440,7 @@ class ThunderbirdMailHandler(BaseEmailClientHandler):
             
         # First pass: check for files with .msf counterparts (standard Thunderbird approach)
         for root, dirs, files in os.walk(directory):
+            self._skip_maildir_subdirs(dirs)
             for file in files:
                 file_path = os.path.join(root, file)
                 
@@ -293,6 +465,7 @@ class ThunderbirdMailHandler(BaseEmailClientHandler):
         # This handles demo mode and some non-standard setups
         if not mail_files:
             for root, dirs, files in os.walk(directory):
+                self._skip_maildir_subdirs(dirs)
                 for file in files:
                     file_path = os.path.join(root, file)
                     
@@ -510,17 +683,18 @@ class GenericMailHandler(BaseEmailClientHandler):
     
     def find_mail_folders(self) -> List[Dict[str, Any]]:
         """Find mail folders in common locations."""
+        mail_folders = list(self.iter_mail_folders())
+        self.mail_folders = mail_folders
+        return mail_folders
+    
+    def iter_mail_folders(self) -> Iterator[Dict[str, Any]]:
+        """Yield mail folders in common locations as they are found."""
         if not self.profile_paths:
             self.find_profile_paths()
-            
-        mail_folders = []
         
         for profile_path in self.profile_paths:
             # Use the generic scan method from the base class
-            mail_folders.extend(self._scan_for_mail_files(profile_path, os.path.basename(profile_path)))
-        
-        self.mail_folders = mail_folders
-        return mail_folders
+            yield from self._iter_mail_files(profile_path, os.path.basename(profile_path))
 
 
 class EmailClientManager:
@@ -536,7 +710,7 @@ class EmailClientManager:
         }
         self.duplicate_groups = []
         self.current_folder = None
-        self.email_cache = {}  # Cache to store email content by group and index
+        self.email_cache = OrderedDict()  # Cache to store email content by group and index
         self.analyzer = EmailAnalyzer()  # Initialize the email analyzer
         self.analysis_results = {}  # Store analysis results
         
@@ -572,6 +746,18 @@ class EmailClientManager:
         
         handler = self.handlers[client_name.lower()]
         return handler.find_mail_folders()
+    
+    def iter_client_folders(self, client_name: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the mail folders of a specific email client.
+        
+        Unlike get_client_folders(), folders are produced while the client's
+        profiles are still being walked where the handler supports it.
+        """
+        if client_name.lower() not in self.handlers:
+            return iter(self.get_client_folders(client_name))
+        
+        return self.handlers[client_name.lower()].iter_mail_folders()
     """Scan mailboxes and identify duplicate emails."""
     
         
@@ -600,14 +786,14 @@ class EmailClientManager:
         # SPECIAL HANDLING FOR DEMO MODE:
         # In demo mode, we know that duplicate messages have identical Message-IDs
         # For the purpose of the demo, we'll consider messages with the same Message-ID as duplicates
-        if message_id in ('<team-meeting-duplicate@example.com>', 
-                          '<company-picnic-duplicate@example.com>',
-                          '<weekly-report-duplicate@example.com>'):
+        if message_id in DEMO_DUPLICATE_MESSAGE_IDS:
             # Just use the Message-ID as the hash for demo messages
-            return hashlib.md5(message_id.encode('utf-8')).hexdigest()
+            hasher = new_email_hasher()
+            hasher.update(message_id.encode('utf-8'))
+            return hasher.hexdigest()
         
         # Normal processing for regular (non-demo) messages
-        hasher = hashlib.md5()
+        hasher = new_email_hasher()
         
         if method in ('strict', 'headers', 'subject-sender'):
             if method == 'subject-sender':
@@ -652,8 +838,66 @@ class EmailClientManager:
         
         return hasher.hexdigest()
     
+    def compute_email_hash_from_dict(self, msg_dict: Dict[str, Any], method: str) -> str:
+        """
+        Compute a hash for an already parsed message dictionary.
+        
+        Same methods as compute_email_hash, but the fields are read straight
+        from the dictionary (lowercase header names plus 'body') so no
+        email.message.Message has to be built first.
+        
+        Args:
+            msg_dict: The message dictionary
+            method: The hash method to use (see compute_email_hash)
+        """
+        subject = str(msg_dict.get('subject', ''))
+        from_addr = str(msg_dict.get('from', ''))
+        date = str(msg_dict.get('date', ''))
+        message_id = str(msg_dict.get('message-id', msg_dict.get('message_id', '')))
+        
+        if message_id in DEMO_DUPLICATE_MESSAGE_IDS:
+            hasher = new_email_hasher()
+            hasher.update(message_id.encode('utf-8'))
+            return hasher.hexdigest()
+        
+        hasher = new_email_hasher()
+        
+        if method == 'subject-sender':
+            hasher.update(f"{subject}|{from_addr}".encode('utf-8', errors='ignore'))
+        elif method in ('strict', 'headers'):
+            hasher.update(f"{message_id}|{date}|{from_addr}|{subject}".encode('utf-8', errors='ignore'))
+        
+        if method not in ('subject-sender', 'headers'):
+            body = msg_dict.get('body')
+            if body:
+                if not isinstance(body, bytes):
+                    body = str(body).encode('utf-8', errors='ignore')
+                hasher.update(body)
+        
+        return hasher.hexdigest()
+    
+    @staticmethod
+    def _add_hashed_message(single_messages: Dict[str, Dict[str, Any]],
+                            duplicate_map: Dict[str, List[Dict[str, Any]]],
+                            email_hash: str, entry: Dict[str, Any]) -> None:
+        """
+        Record a scanned message under its hash.
+        
+        Most messages are unique, so a message seen once is only kept as a
+        single entry in single_messages. A list in duplicate_map is created
+        when a second message with the same hash turns up.
+        """
+        group = duplicate_map.get(email_hash)
+        if group is not None:
+            group.append(entry)
+        elif email_hash in single_messages:
+            duplicate_map[email_hash] = [single_messages.pop(email_hash), entry]
+        else:
+            single_messages[email_hash] = entry
+    
     def scan_folder(self, folder_info: Dict[str, Any], hash_method: str = 'xxh64', 
-                   chunk_size: int = 100, use_cache: bool = True) -> List[Dict[str, Any]]:
+                   chunk_size: int = 100, use_cache: bool = True,
+                   progress_callback: Optional[Callable[[int, int], None]] = None) -> List[Dict[str, Any]]:
         """
         Scan a mail folder for duplicate messages using optimized processing.
         
@@ -662,12 +906,15 @@ class EmailClientManager:
             hash_method: Method to use for determining duplicates ('xxh64', 'md5', 'sha1', etc.)
             chunk_size: Number of messages to process in each chunk
             use_cache: Whether to use the hash cache
+            progress_callback: Optional callable receiving (processed, total)
+                after each chunk, e.g. to drive a GUI progress bar
             
         Returns:
             List of duplicate groups in this folder
         """
         self.current_folder = folder_info
         self.duplicate_groups = []
+        self.email_cache.clear()
         
         try:
             from optimized_email_processor import find_duplicates, EmailHashCache
@@ -688,18 +935,19 @@ class EmailClientManager:
             
             # Process the mailbox
             cache = EmailHashCache() if use_cache else None
+            single_messages = {}
             message_hash_map = {}
             
             # Process in chunks to show progress
             for chunk in self._process_mailbox_chunked(folder_info['path'], chunk_size, hash_method, cache):
                 if self.console:
                     progress.update(task, completed=(chunk['processed'] / chunk['total']) * 100)
+                if progress_callback:
+                    progress_callback(chunk['processed'], chunk['total'])
                 
                 # Update the hash map with messages from this chunk
                 for msg in chunk['messages']:
-                    if msg['hash'] not in message_hash_map:
-                        message_hash_map[msg['hash']] = []
-                    message_hash_map[msg['hash']].append({
+                    self._add_hashed_message(single_messages, message_hash_map, msg['hash'], {
                         'key': msg['key'],
                         'message': msg.get('message'),
                         'subject': msg['subject'],
@@ -711,29 +959,29 @@ class EmailClientManager:
             # Identify duplicate groups
             duplicate_groups = []
             for email_hash, messages in message_hash_map.items():
-                if len(messages) > 1:
-                    # Sort messages by date if available
-                    try:
-                        for msg in messages:
-                            if msg['date']:
-                                try:
-                                    parsed_date = email.utils.parsedate_to_datetime(msg['date'])
-                                    msg['parsed_date'] = parsed_date
-                                except (TypeError, ValueError):
-                                    msg['parsed_date'] = datetime.min
-                            else:
+                # Sort messages by date if available
+                try:
+                    for msg in messages:
+                        if msg['date']:
+                            try:
+                                parsed_date = email.utils.parsedate_to_datetime(msg['date'])
+                                msg['parsed_date'] = parsed_date
+                            except (TypeError, ValueError):
                                 msg['parsed_date'] = datetime.min
-                                
-                        messages.sort(key=lambda x: x['parsed_date'])
-                    except Exception:
-                        # If date sorting fails, continue without it
-                        pass
-                        
-                    duplicate_groups.append({
-                        'hash': email_hash,
-                        'messages': messages,
-                        'count': len(messages)
-                    })
+                        else:
+                            msg['parsed_date'] = datetime.min
+                            
+                    messages.sort(key=lambda x: x['parsed_date'])
+                except Exception:
+                    # If date sorting fails, continue without it
+                    pass
+                    
+                duplicate_groups.append({
+                    'hash': email_hash,
+                    'messages': messages,
+                    'count': len(messages),
+                    'source_folder': folder_info
+                })
             
             # Sort groups by number of duplicates (descending)
             duplicate_groups.sort(key=lambda x: x['count'], reverse=True)
@@ -749,7 +997,7 @@ class EmailClientManager:
             # Fall back to the original implementation if optimized module is not available
             if self.console:
                 self.console.print("[yellow]Optimized processor not found, falling back to standard processing[/yellow]")
-            return self._scan_folder_fallback(folder_info, hash_method)
+            return self._scan_folder_fallback(folder_info, hash_method, progress_callback)
             
         except Exception as e:
             error_msg = f"Error scanning folder {folder_info['display_name']}: {str(e)}"
@@ -759,6 +1007,48 @@ class EmailClientManager:
                 print(error_msg)
             return []
     
+    def scan_folders(self, folders: List[Dict[str, Any]], hash_method: str = 'xxh64',
+                     max_workers: Optional[int] = None,
+                     use_processes: bool = False) -> List[List[Dict[str, Any]]]:
+        """
+        Scan several mail folders for duplicates concurrently.
+        
+        Folders are spread over a thread pool by default, which overlaps the
+        mailbox I/O; with use_processes the hashing and parsing also run in
+        parallel on separate cores. scan_folder keeps per-folder state on the
+        instance, so each folder is scanned by its own EmailClientManager;
+        the merged groups are stored in self.duplicate_groups afterwards.
+        Every group records its mail folder under 'source_folder', which is
+        where delete_duplicates() removes its messages from, so
+        self.current_folder is cleared when several folders were scanned.
+        
+        Args:
+            folders: List of folder info dictionaries to scan
+            hash_method: Method to use for determining duplicates
+            max_workers: Maximum number of folders scanned at once
+                (defaults to min(8, len(folders)) threads, or one process per CPU)
+            use_processes: Scan in a process pool instead of a thread pool
+            
+        Returns:
+            List with the duplicate groups of each folder, in the order of folders
+        """
+        if len(folders) < 2:
+            results = [self.scan_folder(folder, hash_method) for folder in folders]
+        elif use_processes:
+            workers = max_workers or min(os.cpu_count() or 1, len(folders))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_scan_folder_job, folders, repeat(hash_method)))
+        else:
+            workers = max_workers or min(8, len(folders))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_scan_folder_job, folders, repeat(hash_method)))
+        
+        self.duplicate_groups = [group for groups in results for group in groups]
+        if len(folders) > 1:
+            self.current_folder = None
+        self.email_cache.clear()
+        return results
+    
     def _process_mailbox_chunked(self, mbox_path: str, chunk_size: int, 
                               hash_method: str, cache: Any) -> Generator[Dict[str, Any], None, None]:
         """Process mailbox in chunks with progress tracking."""
@@ -820,8 +1110,10 @@ class EmailClientManager:
             if 'mbox' in locals():
                 mbox.close()
     
-    def _scan_folder_fallback(self, folder_info: Dict[str, Any], hash_method: str) -> List[Dict[str, Any]]:
+    def _scan_folder_fallback(self, folder_info: Dict[str, Any], hash_method: str,
+                              progress_callback: Optional[Callable[[int, int], None]] = None) -> List[Dict[str, Any]]:
         """Fallback implementation for when optimized processor is not available."""
+        single_messages = {}
         message_hash_map = {}
         
         try:
@@ -843,10 +1135,7 @@ class EmailClientManager:
                         message = mbox[msg_key]
                         email_hash = self.compute_email_hash(message, hash_method)
                         
-                        if email_hash not in message_hash_map:
-                            message_hash_map[email_hash] = []
-                            
-                        message_hash_map[email_hash].append({
+                        self._add_hashed_message(single_messages, message_hash_map, email_hash, {
                             'key': msg_key,
                             'message': message,
                             'subject': message.get('Subject', '(No Subject)'),
@@ -856,20 +1145,21 @@ class EmailClientManager:
                         })
                         
                         progress.update(task, advance=1)
+                        if progress_callback and i % 100 == 0:
+                            progress_callback(i, total_messages)
             else:
                 # Basic console output
                 print(f"Fallback: Scanning {folder_info['display_name']} ({total_messages} messages)")
                 for i, msg_key in enumerate(mbox.keys()):
                     if i % 100 == 0:
                         print(f"  Processed {i}/{total_messages} messages...", end='\r')
+                        if progress_callback:
+                            progress_callback(i, total_messages)
                         
                     message = mbox[msg_key]
                     email_hash = self.compute_email_hash(message, hash_method)
                     
-                    if email_hash not in message_hash_map:
-                        message_hash_map[email_hash] = []
-                        
-                    message_hash_map[email_hash].append({
+                    self._add_hashed_message(single_messages, message_hash_map, email_hash, {
                         'key': msg_key,
                         'message': message,
                         'subject': message.get('Subject', '(No Subject)'),
@@ -882,29 +1172,29 @@ class EmailClientManager:
             # Extract only the groups with duplicates
             duplicate_groups = []
             for email_hash, messages in message_hash_map.items():
-                if len(messages) > 1:
-                    # Sort messages by date if available
-                    try:
-                        for msg in messages:
-                            if msg['date']:
-                                try:
-                                    parsed_date = email.utils.parsedate_to_datetime(msg['date'])
-                                    msg['parsed_date'] = parsed_date
-                                except (TypeError, ValueError):
-                                    msg['parsed_date'] = datetime.min
-                            else:
+                # Sort messages by date if available
+                try:
+                    for msg in messages:
+                        if msg['date']:
+                            try:
+                                parsed_date = email.utils.parsedate_to_datetime(msg['date'])
+                                msg['parsed_date'] = parsed_date
+                            except (TypeError, ValueError):
                                 msg['parsed_date'] = datetime.min
-                                
-                        messages.sort(key=lambda x: x['parsed_date'])
-                    except Exception:
-                        # If date sorting fails, continue without it
-                        pass
-                        
-                    duplicate_groups.append({
-                        'hash': email_hash,
-                        'messages': messages,
-                        'count': len(messages)
-                    })
+                        else:
+                            msg['parsed_date'] = datetime.min
+                            
+                    messages.sort(key=lambda x: x['parsed_date'])
+                except Exception:
+                    # If date sorting fails, continue without it
+                    pass
+                    
+                duplicate_groups.append({
+                    'hash': email_hash,
+                    'messages': messages,
+                    'count': len(messages),
+                    'source_folder': folder_info
+                })
             
             # Sort groups by number of duplicates (descending)
             duplicate_groups.sort(key=lambda x: x['count'], reverse=True)
@@ -999,19 +1289,30 @@ class EmailClientManager:
                     print(f"   Folder: {msg['folder']}")
                     print()
     
-    def get_email_content(self, group_idx: int, msg_idx: int) -> Dict[str, Any]:
+    def get_email_content(self, group_idx: int, msg_idx: int,
+                          max_bytes: Optional[int] = None) -> Dict[str, Any]:
         """
         Get the full content of an email in a duplicate group.
         
         Args:
             group_idx: Index of the duplicate group
             msg_idx: Index of the message within the group
+            max_bytes: If given, decode at most this many bytes of each body
+                part (e.g. for a quick preview); cut parts are marked with
+                'truncated': True
             
         Returns:
             Dictionary with email headers and content
         """
         if not self.duplicate_groups:
             return {"error": "No duplicate groups available"}
+        
+        # Reuse the content decoded for an earlier preview of this message
+        cache_key = (group_idx, msg_idx, max_bytes)
+        cached = self.email_cache.get(cache_key)
+        if cached is not None:
+            self.email_cache.move_to_end(cache_key)
+            return cached
             
         if group_idx < 0 or group_idx >= len(self.duplicate_groups):
             return {"error": f"Invalid group index: {group_idx}"}
@@ -1023,7 +1324,20 @@ class EmailClientManager:
             return {"error": f"Invalid message index: {msg_idx}"}
             
         msg_info = messages[msg_idx]
-        message = msg_info['message']
+        message = msg_info.get('message')
+        if message is None:
+            # Reload the message from the folder its group was found in
+            folder_info = group.get('source_folder') or self.current_folder
+            if folder_info is None:
+                return {"error": "Mail folder of this message is unknown"}
+            try:
+                mbox = mailbox.mbox(folder_info['path'])
+                try:
+                    message = mbox[msg_info['key']]
+                finally:
+                    mbox.close()
+            except Exception as e:
+                return {"error": f"Error reading message from {folder_info['display_name']}: {str(e)}"}
         
         # Get all headers
         headers = {}
@@ -1037,40 +1351,17 @@ class EmailClientManager:
             if message.is_multipart():
                 for part in message.walk():
                     if part.get_content_maintype() == 'text':
-                        content = part.get_payload(decode=True)
-                        charset = part.get_content_charset() or 'utf-8'
-                        try:
-                            decoded_content = content.decode(charset, errors='replace')
-                            body_parts.append({
-                                'content_type': part.get_content_type(),
-                                'content': decoded_content
-                            })
-                        except Exception as e:
-                            body_parts.append({
-                                'content_type': part.get_content_type(),
-                                'content': f"Error decoding content: {str(e)}"
-                            })
+                        body_parts.append(self._decode_body_part(part, max_bytes))
             else:
-                content = message.get_payload(decode=True)
-                charset = message.get_content_charset() or 'utf-8'
-                try:
-                    decoded_content = content.decode(charset, errors='replace')
-                    body_parts.append({
-                        'content_type': message.get_content_type(),
-                        'content': decoded_content
-                    })
-                except Exception as e:
-                    body_parts.append({
-                        'content_type': message.get_content_type(),
-                        'content': f"Error decoding content: {str(e)}"
-                    })
+                body_parts.append(self._decode_body_part(message, max_bytes))
         except Exception as e:
             body_parts.append({
                 'content_type': 'text/plain',
-                'content': f"Error extracting message content: {str(e)}"
+                'content': f"Error extracting message content: {str(e)}",
+                'truncated': False
             })
         
-        return {
+        content = {
             'group_index': group_idx,
             'message_index': msg_idx,
             'headers': headers,
@@ -1080,6 +1371,50 @@ class EmailClientManager:
             'date': msg_info['date'],
             'folder': msg_info['folder']
         }
+        
+        self.email_cache[cache_key] = content
+        if len(self.email_cache) > EMAIL_CACHE_SIZE:
+            self.email_cache.popitem(last=False)
+        
+        return content
+    
+    @staticmethod
+    def _decode_body_part(part: email.message.Message, max_bytes: Optional[int]) -> Dict[str, Any]:
+        """
+        Decode the payload of a text part into a body part dictionary.
+        
+        Args:
+            part: Message or MIME part with a text payload
+            max_bytes: Maximum number of payload bytes to decode, or None for all
+            
+        Returns:
+            Dictionary with the content type, decoded content and truncated flag
+        """
+        content_type = part.get_content_type()
+        content = part.get_payload(decode=True) or b''
+        charset = part.get_content_charset() or 'utf-8'
+        
+        truncated = max_bytes is not None and len(content) > max_bytes
+        try:
+            if truncated:
+                # An incremental decoder drops a multi-byte character cut in
+                # half at the limit instead of turning it into garbage
+                decoder = codecs.getincrementaldecoder(charset)(errors='replace')
+                decoded_content = decoder.decode(content[:max_bytes], final=False)
+            else:
+                decoded_content = content.decode(charset, errors='replace')
+        except Exception as e:
+            return {
+                'content_type': content_type,
+                'content': f"Error decoding content: {str(e)}",
+                'truncated': False
+            }
+        
+        return {
+            'content_type': content_type,
+            'content': decoded_content,
+            'truncated': truncated
+        }
     
     def delete_duplicates(self, group_indices: List[int], 
                           selection_method: str = 'keep-first') -> Tuple[int, List[str]]:
@@ -1112,14 +1447,23 @@ class EmailClientManager:
         if not valid_indices:
             return 0, errors
         
-        # Open the mailbox
+        # Groups from a multi-folder scan come from different mailboxes, so
+        # each group is deleted from the folder it was found in
+        mailboxes = {}
+        folder_info = self.current_folder
         try:
-            mbox = mailbox.mbox(self.current_folder['path'])
-            
             for idx in valid_indices:
                 group = self.duplicate_groups[idx]
                 messages = group['messages']
                 
+                # Open the mailbox
+                folder_info = group.get('source_folder') or self.current_folder
+                if folder_info is None:
+                    raise ValueError("mail folder of the duplicate group is unknown")
+                mbox = mailboxes.get(folder_info['path'])
+                if mbox is None:
+                    mbox = mailboxes[folder_info['path']] = mailbox.mbox(folder_info['path'])
+                
                 if selection_method == 'interactive':
                     if self.console:
                         self.console.print(f"\n[bold]Duplicate Group {idx+1}[/bold]")
@@ -1230,12 +1574,14 @@ class EmailClientManager:
                                 print(f"Error: {error_msg}")
             
             # Flush changes
-            mbox.flush()
+            for mbox in mailboxes.values():
+                mbox.flush()
             
             return deleted_count, errors
             
         except Exception as e:
-            error_msg = f"Error opening mailbox {self.current_folder['display_name']}: {str(e)}"
+            folder_name = folder_info['display_name'] if folder_info else "(unknown folder)"
+            error_msg = f"Error opening mailbox {folder_name}: {str(e)}"
             if self.console:
                 self.console.print(f"[bold red]{error_msg}[/bold red]")
             else:
@@ -1244,6 +1590,32 @@ class EmailClientManager:
             return 0, [error_msg]
 
 
+def _scan_folder_job(folder_info: Dict[str, Any], hash_method: str) -> List[Dict[str, Any]]:
+    """
+    Scan one folder with a fresh EmailClientManager.
+    
+    Used by EmailClientManager.scan_folders; it lives at module level so it
+    can be sent to worker processes. Only plain dicts are returned: the
+    parsed messages are dropped, as get_email_content() reloads them from
+    'source_folder' by key and delete_duplicates() only needs the key.
+    
+    Args:
+        folder_info: Dictionary with folder path and info
+        hash_method: Method to use for determining duplicates
+        
+    Returns:
+        List of duplicate groups in this folder
+    """
+    scanner = EmailClientManager()
+    # Concurrent rich progress bars would fight over the terminal
+    scanner.console = None
+    groups = scanner.scan_folder(folder_info, hash_method)
+    for group in groups:
+        for msg_info in group['messages']:
+            msg_info.pop('message', None)
+    return groups
+
+
 def create_test_mailbox():
     """Create a test mailbox for demo purposes."""
     temp_dir = tempfile.mkdtemp(prefix="thunderbird_test_")
@@ -1564,8 +1936,10 @@ def main():
     total_dupes = 0
     total_groups = 0
     
-    for folder in folders_to_scan:
-        duplicate_groups = duplicate_finder.scan_folder(folder, args.criteria)
+    folder_results = duplicate_finder.scan_folders(folders_to_scan, args.criteria,
+                                                   use_processes=True)
+    
+    for folder, duplicate_groups in zip(folders_to_scan, folder_results):
         
         if duplicate_groups:
             folder_dupes = sum(group['count'] - 1 for group in duplicate_groups)
@@ -7,6 +7,7 @@ and provides a simple interface for retrieving translated strings.
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
 from PySide6.QtCore import QObject, Signal, Slot, QLocale
@@ -134,6 +135,14 @@ class LanguageManager(QObject):
 # Global instance for convenience
 language_manager = LanguageManager()
 
+@lru_cache(maxsize=512)
+def _get_string_cached(lang: str, key: str, default: Optional[str]) -> str:
+    """Look up an unformatted string, memoized per language."""
+    return language_manager.get(key, default)
+
+# Entries for the previous language are never looked up again; drop them
+language_manager.language_changed.connect(lambda lang_code: _get_string_cached.cache_clear())
+
 def get_string(key: str, default: Optional[str] = None, **kwargs) -> str:
     """
     Convenience function to get a translated string.
@@ -146,4 +155,6 @@ def get_string(key: str, default: Optional[str] = None, **kwargs) -> str:
     Returns:
         str: The translated string, or the key if not found
     """
-    return language_manager.get(key, default, **kwargs)
+    if kwargs:
+        return language_manager.get(key, default, **kwargs)
+    return _get_string_cached(language_manager.get_language(), key, default)
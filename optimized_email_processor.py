@@ -184,7 +184,7 @@ def process_mailbox_chunk(
                     
                     if cached_hash is not None:
                         message_hash = cached_hash
-                        logger.debug(f"Using cached hash for message {j+1}/{total_messages}")
+                        logger.debug("Using cached hash for message %d/%d", j + 1, total_messages)
                     else:
                         # Compute hash if not in cache
                         message_hash = compute_email_hash_fast(msg, hash_method)
@@ -253,7 +253,7 @@ def find_duplicates(
     for chunk in process_mailbox_chunk(mbox_path, chunk_size, hash_method, cache):
         # Update progress
         progress = (chunk['processed'] / chunk['total']) * 100
-        logger.info(f"Processed {chunk['processed']}/{chunk['total']} messages ({progress:.1f}%)")
+        logger.info("Processed %d/%d messages (%.1f%%)", chunk['processed'], chunk['total'], progress)
         
         # Group messages by hash
         for msg in chunk['messages']:
@@ -356,12 +356,28 @@ class AboutDialog(QDialog):
 class About:
     """Helper class to show the about dialog."""
     
-    @staticmethod
-    def show_about(parent: Optional[QWidget] = None):
+    # Building the dialog is the expensive part, so it is built once per
+    # parent and shown again on later calls
+    _dialog: Optional[AboutDialog] = None
+    
+    @classmethod
+    def show_about(cls, parent: Optional[QWidget] = None):
         """Show the about dialog.
         
         Args:
             parent: The parent widget for the dialog.
         """
-        dialog = AboutDialog(parent)
+        dialog = cls._dialog
+        if dialog is None or dialog.parent() is not parent:
+            dialog = AboutDialog(parent)
+            dialog.destroyed.connect(cls._forget_dialog)
+            cls._dialog = dialog
+        else:
+            # The language may have changed since the dialog was built
+            dialog.setWindowTitle(get_string('about'))
         dialog.exec_()
+    
+    @classmethod
+    def _forget_dialog(cls, *args):
+        """Drop the cached dialog once Qt has destroyed it."""
+        cls._dialog = None
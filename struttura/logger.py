@@ -157,13 +157,21 @@ class ThreadSafeLogger:
             # Emit signal for GUI updates
             self._log_signal.log_message.emit(log_entry, level)
 
-    def debug(self, message: str):
-        """Log a debug message."""
-        self._write_log('DEBUG', message)
+    def debug(self, message: str, *args):
+        """Log a debug message.
+        
+        Formatting with %-style args is skipped entirely when DEBUG is
+        disabled on the root logger.
+        """
+        if not logging.getLogger().isEnabledFor(logging.DEBUG):
+            return
+        self._write_log('DEBUG', message % args if args else message)
 
-    def info(self, message: str):
-        """Log an info message."""
-        self._write_log('INFO', message)
+    def info(self, message: str, *args):
+        """Log an info message, formatting %-style args only if INFO is enabled."""
+        if not logging.getLogger().isEnabledFor(logging.INFO):
+            return
+        self._write_log('INFO', message % args if args else message)
 
     def warning(self, message: str):
         """Log a warning message."""
@@ -9,7 +9,6 @@ License: GPL v3.0 (see LICENSE)
 
 import sys
 import os
-import webbrowser
 from pathlib import Path
 
 from PySide6.QtWidgets import (
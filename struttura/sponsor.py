@@ -4,7 +4,6 @@ from PySide6.QtWidgets import (QDialog, QVBoxLayout, QLabel, QPushButton,
 from PySide6.QtGui import QDesktopServices
 from PySide6.QtCore import Qt, QUrl, QSize, QBuffer, QTimer
 from PySide6.QtGui import QPixmap, QImage, QIcon
-import webbrowser
 import os
 import io
 import logging
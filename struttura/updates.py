@@ -17,7 +17,7 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QDialogButtonBox, QCheckBox, QApplication, QTextBrowser, QWidget
 )
-from PySide6.QtCore import Qt, QUrl, QDateTime, QTimer, QObject, Signal
+from PySide6.QtCore import Qt, QUrl, QDateTime, QObject, Signal, QRunnable, QThreadPool
 from PySide6.QtGui import QDesktopServices
 
 # Get the application directory
@@ -27,6 +27,23 @@ UPDATES_FILE = APP_DIR / 'updates.json'
 # Configure logger
 logger = logging.getLogger(__name__)
 
+class UpdateCheckTask(QRunnable):
+    """Runs an update check callable on the global thread pool."""
+    
+    def __init__(self, check: Callable[[], None]):
+        """Initialize the task.
+        
+        Args:
+            check: The blocking check to run in a worker thread.
+        """
+        super().__init__()
+        self.check = check
+    
+    def run(self) -> None:
+        """Run the check."""
+        self.check()
+
+
 class UpdateChecker(QObject):
     """Handles checking for application updates."""
     
@@ -118,8 +135,9 @@ class UpdateChecker(QObject):
                 logger.error(f"Error checking for updates: {error_msg}")
                 self.check_failed.emit(error_msg)
         
-        # Run the check in a separate thread
-        QTimer.singleShot(0, do_check)
+        # Run the check in a separate thread; the signals are emitted from
+        # there and delivered to receivers in the GUI thread as queued calls
+        QThreadPool.globalInstance().start(UpdateCheckTask(do_check))
     
     def _should_check(self) -> bool:
         """Check if we should perform an update check."""
@@ -1,5 +1,7 @@
 # Version information follows Semantic Versioning 2.0.0 (https://semver.org/)
 # Update version numbers as needed for releases
+from functools import lru_cache
+
 VERSION_MAJOR = 2
 VERSION_MINOR = 5
 VERSION_PATCH = 2
@@ -7,9 +9,13 @@ VERSION_PATCH = 2
 # Additional version qualifiers
 VERSION_QUALIFIER = ''  # Could be 'alpha', 'beta', 'rc', or ''
 
+@lru_cache(maxsize=1)
 def get_version():
     """
     Generate a full version string.
+    
+    The version constants never change at runtime, so the string is built
+    once and reused by every caller.
     """
     version_parts = [str(VERSION_MAJOR), str(VERSION_MINOR), str(VERSION_PATCH)]
     version_str = '.'.join(version_parts)
@@ -13,7 +13,7 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QComboBox, QPushButton, QTextEdit,
     QLabel, QFileDialog, QMessageBox, QSpacerItem, QSizePolicy
 )
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QFileSystemWatcher, QTimer
 from PySide6.QtGui import QTextCursor, QTextCharFormat, QColor, QFont
 
 # Import translation
@@ -23,6 +23,13 @@ def tr(key, **kwargs):
     """Translation helper function."""
     return language_manager.get(key, **kwargs)
 
+# Lines kept in the log display; older ones are dropped as new ones arrive
+MAX_LOG_LINES = 20000
+
+# Delay between a change to the shown log file and the refresh, so a burst
+# of log writes is read in one go
+LOG_REFRESH_DELAY_MS = 200
+
 class LogViewer(QDialog):
     """Log viewer dialog for viewing and managing application logs."""
     
@@ -33,18 +40,25 @@ class LogViewer(QDialog):
         self.current_log_file = None
         self.log_dir = Path("logs")
         
+        # (file, level filter) shown and bytes of that file already displayed
+        self._log_state = None
+        self._log_offset = 0
+        
         # Ensure logs directory exists
         self.log_dir.mkdir(exist_ok=True)
         
+        # Refresh when the shown log file is written to instead of polling it;
+        # the single-shot timer folds a burst of writes into one refresh
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(LOG_REFRESH_DELAY_MS)
+        self.refresh_timer.timeout.connect(self.refresh_log)
+        self.file_watcher = QFileSystemWatcher(self)
+        self.file_watcher.fileChanged.connect(lambda path: self.refresh_timer.start())
+        
         self.setup_ui()
         self.load_log_files()
         self.apply_dark_theme()
-        
-        # Auto-refresh timer - created in the main thread context
-        self.refresh_timer = QTimer()
-        self.refresh_timer.setTimerType(Qt.VeryCoarseTimer)  # More efficient for this use case
-        self.refresh_timer.timeout.connect(self.refresh_log)
-        self.refresh_timer.start(5000)  # Refresh every 5 seconds
     
     def setup_ui(self):
         """Set up the user interface."""
@@ -94,6 +108,8 @@ class LogViewer(QDialog):
         self.log_display = QTextEdit()
         self.log_display.setReadOnly(True)
         self.log_display.setFont(QFont("Consolas", 10))
+        # Also turns off the undo history, which a read-only view never needs
+        self.log_display.document().setMaximumBlockCount(MAX_LOG_LINES)
         layout.addWidget(self.log_display)
         
         # Bottom buttons
@@ -179,20 +195,47 @@ class LogViewer(QDialog):
         self.refresh_log()
     
     def refresh_log(self):
-        """Refresh the log display with current filters."""
+        """
+        Refresh the log display with current filters.
+        
+        Only the lines written since the last refresh are read and appended;
+        the log is reloaded from the start when the file or the level filter
+        changes, or when the file has been truncated.
+        """
         if not self.current_log_file or not self.current_log_file.exists():
             self.log_display.clear()
+            self._log_state = None
             return
         
         try:
-            with open(self.current_log_file, 'r', encoding='utf-8') as f:
-                logs = f.readlines()
-            
-            self.log_display.clear()
-            
             # Get selected log level filter
             selected_level = self.level_filter.currentText()
             
+            state = (self.current_log_file, selected_level)
+            size = self.current_log_file.stat().st_size
+            if state != self._log_state or size < self._log_offset:
+                self.log_display.clear()
+                self._log_state = state
+                self._log_offset = 0
+                self.watch_log_file(self.current_log_file)
+            
+            if size == self._log_offset:
+                return  # Nothing new since the last refresh
+            
+            with open(self.current_log_file, 'rb') as f:
+                f.seek(self._log_offset)
+                data = f.read()
+            
+            # Leave a line that is still being written for the next refresh
+            end = data.rfind(b'\n') + 1
+            if not end:
+                return
+            self._log_offset += end
+            logs = data[:end].decode('utf-8', errors='replace').splitlines()
+            
+            # Group consecutive lines of the same level, so each run is
+            # inserted into the document with one call
+            runs = []
             for line in logs:
                 if not line.strip():
                     continue
@@ -202,14 +245,28 @@ class LogViewer(QDialog):
                 if selected_level != tr('log_viewer.all_levels') and log_level != selected_level:
                     continue
                 
-                # Add log line with appropriate formatting
-                self.append_log_line(line, log_level)
+                if runs and runs[-1][1] == log_level:
+                    runs[-1][0].append(line)
+                else:
+                    runs.append(([line], log_level))
+            
+            # Add log lines with appropriate formatting
+            for lines, log_level in runs:
+                self.append_log_line("\n".join(lines) + "\n", log_level)
             
             # Scroll to bottom
             self.log_display.moveCursor(QTextCursor.End)
             
         except Exception as e:
             self.log_display.setPlainText(tr('log_viewer.error_loading_log').format(error=str(e)))
+            self._log_state = None
+    
+    def watch_log_file(self, log_file):
+        """Watch only the given log file for changes."""
+        watched = self.file_watcher.files()
+        if watched:
+            self.file_watcher.removePaths(watched)
+        self.file_watcher.addPath(str(log_file))
     
     def get_log_level(self, log_line):
         """Extract log level from log line."""
@@ -219,7 +276,7 @@ class LogViewer(QDialog):
         return 'INFO'
     
     def append_log_line(self, line, level):
-        """Append a log line with appropriate formatting."""
+        """Append one or more log lines of the same level with appropriate formatting."""
         cursor = self.log_display.textCursor()
         cursor.movePosition(QTextCursor.End)
         
@@ -0,0 +1,41 @@
+"""Tests for email_analyzer.EmailAnalyzer."""
+
+import gc
+import os
+import sys
+import weakref
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from email_analyzer import EmailAnalyzer
+
+
+class _Message(dict):
+    """Message dict that can be weakly referenced."""
+
+
+class _HeaderFinder:
+    """Minimal duplicate finder hashing the parsed Message headers."""
+
+    def compute_email_hash(self, msg, method):
+        return f"{method}:{msg.get('subject')}"
+
+
+def test_generate_report_does_not_keep_streamed_messages():
+    analyzer = EmailAnalyzer(duplicate_finder=_HeaderFinder())
+    refs = []
+
+    def stream():
+        for i in range(1000):
+            msg = _Message(subject=f"Subject {i % 10}", body='x' * 10240)
+            refs.append(weakref.ref(msg))
+            yield msg
+
+    report = analyzer.generate_report(stream())
+    gc.collect()
+
+    assert report['summary']['total_emails'] == 1000
+    assert report['duplicates']['duplicate_groups'] == 10
+    assert not analyzer._hash_cache
+    assert not analyzer._email_cache
+    assert all(ref() is None for ref in refs)
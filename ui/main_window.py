@@ -13,6 +13,7 @@ from PySide6.QtWidgets import (
     QMainWindow, QVBoxLayout, QWidget, QTabWidget, QStatusBar, QMessageBox
 )
 from PySide6.QtCore import Qt, QTimer, QSettings
+from PySide6.QtGui import QPalette
 
 from .tabs.scan_tab import ScanTab
 from .tabs.results_tab import ResultsTab
@@ -23,6 +24,23 @@ from ..struttura.updates import UpdateChecker
 from ..lang.lang_manager import get_string
 from ..email_duplicate_cleaner import EmailClientManager
 
+# Colors the dark theme sets on top of the window's normal palette
+DARK_PALETTE_COLORS = (
+    (QPalette.ColorRole.Window, Qt.darkGray),
+    (QPalette.ColorRole.WindowText, Qt.white),
+    (QPalette.ColorRole.Base, Qt.darkGray),
+    (QPalette.ColorRole.AlternateBase, Qt.gray),
+    (QPalette.ColorRole.ToolTipBase, Qt.white),
+    (QPalette.ColorRole.ToolTipText, Qt.white),
+    (QPalette.ColorRole.Text, Qt.white),
+    (QPalette.ColorRole.Button, Qt.darkGray),
+    (QPalette.ColorRole.ButtonText, Qt.white),
+    (QPalette.ColorRole.BrightText, Qt.red),
+    (QPalette.ColorRole.Link, Qt.cyan),
+    (QPalette.ColorRole.Highlight, Qt.cyan),
+    (QPalette.ColorRole.HighlightedText, Qt.black),
+)
+
 class EmailCleanerGUI(QMainWindow):
     """
     Main window for the Email Duplicate Cleaner application.
@@ -48,6 +66,7 @@ class EmailCleanerGUI(QMainWindow):
         self.temp_dir = None
         self.debug_mode = False
         self.dark_mode = False
+        self._dark_palette = None
         
         # Initialize update checker
         from struttura.version import __version__
@@ -58,6 +77,10 @@ class EmailCleanerGUI(QMainWindow):
         setup_traceback_handler()
         logging.info("Application started (PySide6 GUI)")
         
+        # Load settings (and apply the theme) before any child widget exists,
+        # so the palette is not propagated to and re-polished on every widget
+        self.load_settings()
+        
         # Create the main widget and layout
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
@@ -81,9 +104,6 @@ class EmailCleanerGUI(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage(get_string('ready_status'))
         
-        # Load settings
-        self.load_settings()
-        
         # Check for updates after a short delay
         QTimer.singleShot(2000, self.check_for_updates)
     
@@ -129,23 +149,15 @@ class EmailCleanerGUI(QMainWindow):
     
     def set_dark_theme(self):
         """Apply a dark theme to the application."""
-        # Set dark palette
-        dark_palette = self.palette()
-        dark_palette.setColor(dark_palette.Window, Qt.darkGray)
-        dark_palette.setColor(dark_palette.WindowText, Qt.white)
-        dark_palette.setColor(dark_palette.Base, Qt.darkGray)
-        dark_palette.setColor(dark_palette.AlternateBase, Qt.gray)
-        dark_palette.setColor(dark_palette.ToolTipBase, Qt.white)
-        dark_palette.setColor(dark_palette.ToolTipText, Qt.white)
-        dark_palette.setColor(dark_palette.Text, Qt.white)
-        dark_palette.setColor(dark_palette.Button, Qt.darkGray)
-        dark_palette.setColor(dark_palette.ButtonText, Qt.white)
-        dark_palette.setColor(dark_palette.BrightText, Qt.red)
-        dark_palette.setColor(dark_palette.Link, Qt.cyan)
-        dark_palette.setColor(dark_palette.Highlight, Qt.cyan)
-        dark_palette.setColor(dark_palette.HighlightedText, Qt.black)
-        
-        self.setPalette(dark_palette)
+        # Build the dark palette on first use only; later toggles swap it in
+        # with a single setPalette call that Qt propagates to every child
+        if self._dark_palette is None:
+            dark_palette = QPalette(self.palette())
+            for role, color in DARK_PALETTE_COLORS:
+                dark_palette.setColor(role, color)
+            self._dark_palette = dark_palette
+        
+        self.setPalette(self._dark_palette)
     
     def set_light_theme(self):
         """Apply a light theme to the application."""
@@ -4,20 +4,50 @@ Console output redirection for PySide6 applications.
 This module provides a way to redirect stdout and stderr to a QTextEdit widget.
 """
 
-from PySide6.QtCore import QObject, Signal
+import threading
+
+from PySide6.QtCore import QObject, Qt, Signal, Slot
 
 class RedirectStream(QObject):
     """
     A file-like object that emits a signal when written to.
     
-    This allows redirecting stdout/stderr to a QTextEdit widget.
+    This allows redirecting stdout/stderr to a QTextEdit widget. Writes are
+    buffered and delivered as one batch per event-loop pass, so a burst of
+    output (from any thread) results in a single text_written emission
+    instead of one per write() call.
     """
     text_written = Signal(str)
+    _flush_requested = Signal()
+    
+    def __init__(self, parent=None):
+        """Initialize the stream with an empty write buffer."""
+        super().__init__(parent)
+        self._buffer = []
+        self._lock = threading.Lock()
+        
+        # Always queued, so the drain runs from the event loop of the
+        # stream's thread even when write() is called on the same thread
+        self._flush_requested.connect(self._drain, Qt.QueuedConnection)
     
     def write(self, text):
-        """Emit the text that was written to the stream."""
-        self.text_written.emit(str(text))
+        """Buffer the text and schedule a drain if none is pending."""
+        with self._lock:
+            schedule = not self._buffer
+            self._buffer.append(str(text))
+        
+        if schedule:
+            self._flush_requested.emit()
+    
+    @Slot()
+    def _drain(self):
+        """Emit everything written since the last drain as one string."""
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+        
+        if batch:
+            self.text_written.emit("".join(batch))
     
     def flush(self):
-        """Flush the stream (no-op for this implementation)."""
+        """Flush the stream (no-op; buffered text is drained by the event loop)."""
         pass
@@ -7,7 +7,12 @@ for image processing and previews.
 """
 
 import os
+import shutil
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
 from wand.image import Image as WandImage
 
@@ -21,6 +26,39 @@ from PySide6.QtGui import QDesktopServices, QAction, QPixmap, QIcon
 
 from .. import get_string
 
+# Delay before the preview follows the selection, so keyboard navigation
+# through the tree only renders the row it stops on
+PREVIEW_DELAY_MS = 120
+
+# Longest email body rendered in the preview panel; the rest is cut off
+MAX_PREVIEW_CHARS = 256 * 1024
+
+# Worker threads that render attachment thumbnails for the preview
+THUMBNAIL_WORKERS = 2
+
+# Document head and style sheet shared by every email preview
+PREVIEW_HEAD = """
+        <html>
+        <head>
+            <style>
+                body { font-family: Arial, sans-serif; line-height: 1.6; margin: 0; padding: 10px; }
+                .header { margin-bottom: 15px; padding-bottom: 10px; border-bottom: 1px solid #ddd; }
+                .field { margin-bottom: 8px; }
+                .field-label { font-weight: bold; color: #555; }
+                .body { margin-top: 15px; white-space: pre-wrap; }
+                .attachments { margin-top: 15px; padding-top: 10px; border-top: 1px solid #eee; }
+                .attachment { margin: 5px 0; padding: 5px; background: #f5f5f5; border-radius: 3px; }
+            </style>
+        </head>
+"""
+
+def _remove_temp_dir(path):
+    """Delete a temporary directory tree, reporting instead of raising errors."""
+    try:
+        shutil.rmtree(path)
+    except Exception as e:
+        print(f"Error cleaning up temp directory: {e}")
+
 class ResultsTab(QWidget):
     """
     Tab for displaying and managing duplicate email groups.
@@ -33,6 +71,14 @@ class ResultsTab(QWidget):
     # Signals
     clean_requested = Signal(list)  # List of group indices to clean
     preview_requested = Signal(dict)  # Email data for preview
+    thumbnail_ready = Signal(int, int, str)  # preview, attachment, path; emitted from a worker
+    
+    # Header fields shown in the preview: (label key, email field, fallback key)
+    _PREVIEW_FIELDS = (
+        ('preview_from', 'from', 'unknown_sender'),
+        ('preview_to', 'to', 'unknown_recipient'),
+        ('preview_date', 'date', 'unknown_date'),
+    )
     
     def __init__(self, parent=None):
         """Initialize the results tab."""
@@ -41,15 +87,30 @@ class ResultsTab(QWidget):
         self.duplicate_groups = []
         self.temp_dir = None
         
+        # Preview HTML with a placeholder per pending thumbnail, and a counter
+        # telling thumbnails of an older preview apart from the current one
+        self._preview_html = ""
+        self._preview_number = 0
+        
         # Create temporary directory for preview images
         self.create_temp_dir()
         
+        # Thumbnails are rendered here and added to the preview when ready
+        self._thumbnail_executor = ThreadPoolExecutor(max_workers=THUMBNAIL_WORKERS)
+        self.thumbnail_ready.connect(self.show_thumbnail)
+        
         self.init_ui()
     
     def init_ui(self):
         """Initialize the UI components."""
         main_layout = QVBoxLayout(self)
         
+        # Debounce preview updates while the selection is changing
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(PREVIEW_DELAY_MS)
+        self._preview_timer.timeout.connect(self.update_preview)
+        
         # Create splitter for results and preview
         self.splitter = QSplitter(Qt.Horizontal)
         
@@ -64,8 +125,11 @@ class ResultsTab(QWidget):
         self.results_tree.setSelectionMode(QTreeWidget.ExtendedSelection)
         self.results_tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.results_tree.customContextMenuRequested.connect(self.show_context_menu)
-        self.results_tree.itemSelectionChanged.connect(self.update_preview)
+        self.results_tree.itemSelectionChanged.connect(self._preview_timer.start)
         self.results_tree.setSelectionBehavior(QTreeWidget.SelectRows)
+        # All rows are one line of text; lets the view lay out a large result
+        # set without asking every row for its size
+        self.results_tree.setUniformRowHeights(True)
         self.results_tree.setIndentation(20)
         self.results_tree.setColumnWidth(0, 150)  # Date
         self.results_tree.setColumnWidth(1, 200)  # From
@@ -120,6 +184,32 @@ class ResultsTab(QWidget):
         self.btn_export.clicked.connect(self.export_results)
         self.btn_clean_selected.clicked.connect(self.clean_selected_groups)
         self.btn_clean_all.clicked.connect(self.clean_all_groups)
+        
+        self.create_context_menu()
+    
+    def create_context_menu(self):
+        """
+        Build the context menu for email rows once.
+        
+        show_context_menu() only records the clicked email and shows this
+        menu, instead of creating a new menu and its actions on every click.
+        """
+        self._context_email = None
+        self.email_menu = QMenu(self)
+        
+        view_action = QAction(get_string('menu_view_email'), self.email_menu)
+        view_action.triggered.connect(lambda: self.view_email(self._context_email))
+        self.email_menu.addAction(view_action)
+        
+        open_folder_action = QAction(get_string('menu_open_containing_folder'), self.email_menu)
+        open_folder_action.triggered.connect(lambda: self.open_containing_folder(self._context_email))
+        self.email_menu.addAction(open_folder_action)
+        
+        self.email_menu.addSeparator()
+        
+        copy_action = QAction(get_string('menu_copy_email_info'), self.email_menu)
+        copy_action.triggered.connect(lambda: self.copy_email_info(self._context_email))
+        self.email_menu.addAction(copy_action)
     
     def create_temp_dir(self):
         """Create a temporary directory for preview images."""
@@ -131,11 +221,13 @@ class ResultsTab(QWidget):
     def cleanup_temp_dir(self):
         """Clean up the temporary directory and its contents."""
         if self.temp_dir and os.path.exists(self.temp_dir):
-            try:
-                import shutil
-                shutil.rmtree(self.temp_dir)
-            except Exception as e:
-                print(f"Error cleaning up temp directory: {e}")
+            # Delete on a non-daemon thread, so closing does not wait for the
+            # thumbnails to be removed but the process still finishes the job
+            threading.Thread(
+                target=_remove_temp_dir, args=(self.temp_dir,),
+                name="temp-dir-cleanup"
+            ).start()
+            self.temp_dir = None
     
     def update_results(self, duplicate_groups):
         """
@@ -145,35 +237,75 @@ class ResultsTab(QWidget):
             duplicate_groups: List of duplicate email groups
         """
         self.duplicate_groups = duplicate_groups
-        self.results_tree.clear()
         
+        # Labels shared by every group row
+        group_label = get_string('results_group')
+        emails_label = get_string('results_emails')
+        
+        # Names used for every row, bound once outside the loops
+        format_size = self.format_size
+        new_item = QTreeWidgetItem
+        user_role = Qt.UserRole
+        
+        # Build the whole tree detached from the widget first
+        group_items = []
         for i, group in enumerate(duplicate_groups):
             if not group:
                 continue
                 
             # Create group item
-            group_item = QTreeWidgetItem([
+            group_item = new_item([
                 "",  # Date
-                f"{get_string('results_group')} {i+1} ({len(group)} {get_string('results_emails')})",
+                f"{group_label} {i+1} ({len(group)} {emails_label})",
                 "",  # Subject
-                self.format_size(sum(email.get('size', 0) for email in group))
+                format_size(sum(email.get('size', 0) for email in group))
             ])
-            group_item.setData(0, Qt.UserRole, {'type': 'group', 'index': i})
-            self.results_tree.addTopLevelItem(group_item)
+            group_item.setData(0, user_role, {'type': 'group', 'index': i})
             
             # Add email items
+            email_items = []
+            add_email_item = email_items.append
             for email in group:
-                email_item = QTreeWidgetItem([
-                    email.get('date', ''),
-                    email.get('from', ''),
-                    email.get('subject', ''),
-                    self.format_size(email.get('size', 0))
+                get = email.get
+                email_item = new_item([
+                    get('date', ''),
+                    get('from', ''),
+                    get('subject', ''),
+                    format_size(get('size', 0))
                 ])
-                email_item.setData(0, Qt.UserRole, {'type': 'email', 'data': email})
-                group_item.addChild(email_item)
+                email_item.setData(0, user_role, {'type': 'email', 'data': email, 'group': i})
+                add_email_item(email_item)
+            group_item.addChildren(email_items)
+            group_items.append(group_item)
+        
+        # Swap the contents in one go
+        with self._frozen_tree():
+            self.results_tree.clear()
+            self.results_tree.addTopLevelItems(group_items)
             
-            # Expand the group by default
-            group_item.setExpanded(True)
+            # Expand the groups by default
+            self.results_tree.expandAll()
+        
+        # The previewed email (if any) is no longer in the tree
+        self._preview_timer.stop()
+        self._preview_number += 1
+        self.preview_panel.clear()
+    
+    @contextmanager
+    def _frozen_tree(self):
+        """
+        Suspend repaints and signals of the results tree for a bulk change.
+        
+        While frozen, removing or adding rows neither repaints the tree nor
+        emits itemSelectionChanged, so the preview is not rebuilt per row.
+        """
+        self.results_tree.setUpdatesEnabled(False)
+        self.results_tree.blockSignals(True)
+        try:
+            yield
+        finally:
+            self.results_tree.blockSignals(False)
+            self.results_tree.setUpdatesEnabled(True)
     
     def update_preview(self):
         """Update the preview panel with the selected email content."""
@@ -184,6 +316,9 @@ class ResultsTab(QWidget):
         item = selected_items[0]
         item_data = item.data(0, Qt.UserRole)
         
+        # Thumbnails still being rendered belong to the previous preview
+        self._preview_number += 1
+        
         if not item_data or item_data.get('type') != 'email':
             self.preview_panel.clear()
             return
@@ -191,41 +326,26 @@ class ResultsTab(QWidget):
         email_data = item_data.get('data', {})
         if not email_data:
             return
+        
+        attachments = email_data.get('attachments', [])
             
         # Format email content for preview
-        html = f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; margin: 0; padding: 10px; }}
-                .header {{ margin-bottom: 15px; padding-bottom: 10px; border-bottom: 1px solid #ddd; }}
-                .field {{ margin-bottom: 8px; }}
-                .field-label {{ font-weight: bold; color: #555; }}
-                .body {{ margin-top: 15px; white-space: pre-wrap; }}
-                .attachments {{ margin-top: 15px; padding-top: 10px; border-top: 1px solid #eee; }}
-                .attachment {{ margin: 5px 0; padding: 5px; background: #f5f5f5; border-radius: 3px; }}
-            </style>
-        </head>
+        html = PREVIEW_HEAD + f"""
         <body>
             <div class="header">
                 <h2>{email_data.get('subject', get_string('no_subject'))}</h2>
             </div>
-            
-            <div class="field">
-                <span class="field-label">{get_string('preview_from')}:</span>
-                <span>{email_data.get('from', get_string('unknown_sender'))}</span>
-            </div>
-            
-            <div class="field">
-                <span class="field-label">{get_string('preview_to')}:</span>
-                <span>{email_data.get('to', get_string('unknown_recipient'))}</span>
-            </div>
-            
+        """
+        
+        for label_key, field, fallback_key in self._PREVIEW_FIELDS:
+            html += f"""
             <div class="field">
-                <span class="field-label">{get_string('preview_date')}:</span>
-                <span>{email_data.get('date', get_string('unknown_date'))}</span>
+                <span class="field-label">{get_string(label_key)}:</span>
+                <span>{email_data.get(field, get_string(fallback_key))}</span>
             </div>
-            
+            """
+        
+        html += f"""
             <div class="field">
                 <span class="field-label">{get_string('preview_size')}:</span>
                 <span>{self.format_size(email_data.get('size', 0))}</span>
@@ -234,6 +354,9 @@ class ResultsTab(QWidget):
         
         # Add email body
         body = email_data.get('body', '')
+        if len(body) > MAX_PREVIEW_CHARS:
+            omitted = len(body) - MAX_PREVIEW_CHARS
+            body = f"{body[:MAX_PREVIEW_CHARS]}\n\n[... {omitted} characters truncated ...]"
         if body:
             html += f"""
             <div class="body">
@@ -242,24 +365,27 @@ class ResultsTab(QWidget):
             """
         
         # Add attachments if any
-        attachments = email_data.get('attachments', [])
         if attachments:
             html += """
             <div class="attachments">
                 <div class="field-label">Attachments:</div>
             """
+            self.create_temp_dir()
             
             for i, attachment in enumerate(attachments, 1):
                 filename = attachment.get('filename', f'file_{i}')
                 size = self.format_size(attachment.get('size', 0))
                 content_type = attachment.get('content_type', 'application/octet-stream')
                 
-                # Generate thumbnail for images using Wand
+                # Leave a placeholder for images; Wand renders the thumbnail
+                # on a worker thread and show_thumbnail() fills it in
                 thumbnail_html = ""
                 if content_type.startswith('image/'):
-                    thumbnail_path = self.generate_thumbnail(attachment)
-                    if thumbnail_path:
-                        thumbnail_html = f'<br><img src="{thumbnail_path}" style="max-width: 200px; max-height: 150px; margin-top: 5px;">'
+                    thumbnail_html = self._thumbnail_placeholder(i)
+                    future = self._thumbnail_executor.submit(
+                        self.generate_thumbnail, attachment, self.temp_dir)
+                    future.add_done_callback(
+                        partial(self._thumbnail_done, self._preview_number, i))
                 
                 html += f"""
                 <div class="attachment">
@@ -276,14 +402,51 @@ class ResultsTab(QWidget):
         html += "</body></html>"
         
         # Set HTML content
+        self._preview_html = html
         self.preview_panel.setHtml(html)
     
-    def generate_thumbnail(self, attachment):
+    def _thumbnail_done(self, preview_number, attachment_number, future):
+        """Hand a finished thumbnail job over to the GUI thread."""
+        if not future.cancelled():
+            self.thumbnail_ready.emit(preview_number, attachment_number, future.result() or "")
+    
+    @staticmethod
+    def _thumbnail_placeholder(number):
+        """Return the marker left in the preview HTML for a pending thumbnail."""
+        return f"<!-- thumbnail {number} -->"
+    
+    def show_thumbnail(self, preview_number, attachment_number, thumbnail_path):
+        """
+        Put a rendered thumbnail in place of its placeholder in the preview.
+        
+        Args:
+            preview_number: Preview the thumbnail was requested for
+            attachment_number: Position of the attachment in the email
+            thumbnail_path: Path to the thumbnail, or "" if rendering failed
+        """
+        if preview_number != self._preview_number or not thumbnail_path:
+            return
+        
+        thumbnail_html = f'<br><img src="{thumbnail_path}" style="max-width: 200px; max-height: 150px; margin-top: 5px;">'
+        self._preview_html = self._preview_html.replace(
+            self._thumbnail_placeholder(attachment_number), thumbnail_html)
+        
+        # Re-render without moving the reader's scroll position
+        scroll_bar = self.preview_panel.verticalScrollBar()
+        position = scroll_bar.value()
+        self.preview_panel.setHtml(self._preview_html)
+        scroll_bar.setValue(position)
+    
+    def generate_thumbnail(self, attachment, temp_dir):
         """
         Generate a thumbnail for an image attachment using Wand.
         
+        Runs on the thumbnail worker threads, so the directory is created
+        by the caller on the GUI thread.
+        
         Args:
             attachment: Dictionary containing attachment data
+            temp_dir: Existing directory the thumbnail is written to
             
         Returns:
             Path to the generated thumbnail or None if generation failed
@@ -292,16 +455,13 @@ class ResultsTab(QWidget):
             return None
             
         try:
-            # Create temp directory if it doesn't exist
-            self.create_temp_dir()
-            
             # Generate a unique filename for the thumbnail
             filename = attachment.get('filename', 'preview')
             ext = os.path.splitext(filename)[1].lower()
             if not ext:
                 ext = '.jpg'
                 
-            temp_path = os.path.join(self.temp_dir, f"thumb_{hash(str(attachment))}{ext}")
+            temp_path = os.path.join(temp_dir, f"thumb_{hash(str(attachment))}{ext}")
             
             # Create thumbnail using Wand
             with WandImage(blob=attachment['data']) as img:
@@ -322,27 +482,11 @@ class ResultsTab(QWidget):
             return
             
         item_data = item.data(0, Qt.UserRole)
-        if not item_data:
+        if not item_data or item_data.get('type') != 'email':
             return
-            
-        menu = QMenu(self)
         
-        if item_data.get('type') == 'email':
-            view_action = QAction(get_string('menu_view_email'), self)
-            view_action.triggered.connect(lambda: self.view_email(item_data['data']))
-            menu.addAction(view_action)
-            
-            open_folder_action = QAction(get_string('menu_open_containing_folder'), self)
-            open_folder_action.triggered.connect(lambda: self.open_containing_folder(item_data['data']))
-            menu.addAction(open_folder_action)
-            
-            menu.addSeparator()
-            
-            copy_action = QAction(get_string('menu_copy_email_info'), self)
-            copy_action.triggered.connect(lambda: self.copy_email_info(item_data['data']))
-            menu.addAction(copy_action)
-        
-        menu.exec_(self.results_tree.viewport().mapToGlobal(position))
+        self._context_email = item_data['data']
+        self.email_menu.exec_(self.results_tree.viewport().mapToGlobal(position))
     
     def view_email(self, email_data):
         """View the full email in a separate window."""
@@ -375,15 +519,12 @@ class ResultsTab(QWidget):
     
     def expand_all_groups(self):
         """Expand all groups in the results tree."""
-        for i in range(self.results_tree.topLevelItemCount()):
-            item = self.results_tree.topLevelItem(i)
-            item.setExpanded(True)
+        # One view-level call with a single relayout, instead of one per group
+        self.results_tree.expandAll()
     
     def collapse_all_groups(self):
         """Collapse all groups in the results tree."""
-        for i in range(self.results_tree.topLevelItemCount()):
-            item = self.results_tree.topLevelItem(i)
-            item.setExpanded(False)
+        self.results_tree.collapseAll()
     
     def clean_selected_groups(self):
         """Clean the selected duplicate groups."""
@@ -393,21 +534,13 @@ class ResultsTab(QWidget):
             return
             
         # Get unique group indices from selected items
-        group_indices = set()
-        for item in selected_items:
-            item_data = item.data(0, Qt.UserRole)
-            if not item_data:
-                continue
-                
-            if item_data.get('type') == 'group':
-                group_indices.add(item_data.get('index'))
-            elif item_data.get('type') == 'email':
-                # Find the parent group
-                parent = item.parent()
-                if parent:
-                    parent_data = parent.data(0, Qt.UserRole)
-                    if parent_data and parent_data.get('type') == 'group':
-                        group_indices.add(parent_data.get('index'))
+        # (group rows store their own index, email rows that of their group)
+        selected_data = [item.data(0, Qt.UserRole) or {} for item in selected_items]
+        group_indices = {
+            item_data['index'] if item_data['type'] == 'group' else item_data['group']
+            for item_data in selected_data
+            if item_data.get('type') in ('group', 'email')
+        }
         
         if not group_indices:
             QMessageBox.warning(self, get_string('warning'), get_string('no_valid_groups_selected'))
@@ -549,5 +682,8 @@ class ResultsTab(QWidget):
     
     def closeEvent(self, event):
         """Clean up resources when the tab is closed."""
+        # Drop queued thumbnails and let running ones finish before their
+        # directory goes away
+        self._thumbnail_executor.shutdown(wait=True, cancel_futures=True)
         self.cleanup_temp_dir()
         event.accept()
\ No newline at end of file
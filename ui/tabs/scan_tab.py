@@ -6,13 +6,14 @@ email folders for duplicates.
 """
 
 import threading
+from difflib import SequenceMatcher
 from pathlib import Path
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QRadioButton,
     QButtonGroup, QListWidget, QCheckBox, QPushButton, QMessageBox
 )
-from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtCore import Signal, Slot
 
 from .. import get_string
 
@@ -27,12 +28,16 @@ class ScanTab(QWidget):
     # Signals
     scan_started = Signal()
     scan_completed = Signal(list, str)  # folders, criteria
+    folders_found = Signal(list)  # mail folders, emitted from the search thread
+    folder_search_failed = Signal(str)  # error message
     
     def __init__(self, parent=None):
         """Initialize the scan tab."""
         super().__init__(parent)
         self.parent = parent
         self.mail_folders = []
+        # (display name, path) of every row currently in the folder list
+        self._displayed_folders = []
         
         self.init_ui()
     
@@ -95,6 +100,7 @@ class ScanTab(QWidget):
         
         self.folder_list = QListWidget()
         self.folder_list.setSelectionMode(self.folder_list.MultiSelection)
+        self.folder_list.setUniformItemSizes(True)
         
         folder_layout.addWidget(self.folder_list)
         folder_group.setLayout(folder_layout)
@@ -120,6 +126,8 @@ class ScanTab(QWidget):
         self.btn_find_folders.clicked.connect(self.find_mail_folders)
         self.btn_select_all.clicked.connect(self.select_all_folders)
         self.btn_scan.clicked.connect(self.start_scan)
+        self.folders_found.connect(self.on_folders_found)
+        self.folder_search_failed.connect(self.on_folder_search_failed)
         
         # Set defaults
         self.radio_client_all.setChecked(True)
@@ -138,21 +146,86 @@ class ScanTab(QWidget):
         elif self.radio_client_gen.isChecked():
             client_type = "generic"
         
+        # Walking the mail directories can take a while; keep the UI responsive
+        self.btn_find_folders.setEnabled(False)
+        self.btn_scan.setEnabled(False)
+        
+        self.folder_search_thread = threading.Thread(
+            target=self._find_folders,
+            args=(client_type,)
+        )
+        self.folder_search_thread.daemon = True
+        self.folder_search_thread.start()
+    
+    def _find_folders(self, client_type):
+        """
+        Look up mail folders (runs in a separate thread).
+        
+        Args:
+            client_type: Email client to search, or None for all clients
+        """
+        client_manager = self.parent.client_manager
         try:
-            self.mail_folders = self.parent.client_manager.find_mail_folders(client_type)
-            self.update_folder_list()
+            if client_type:
+                folders = client_manager.get_client_folders(client_type)
+            else:
+                folders = client_manager.get_all_mail_folders()
         except Exception as e:
-            QMessageBox.critical(self, get_string('error'), 
-                               get_string('error_finding_folders').format(error=str(e)))
+            self.folder_search_failed.emit(str(e))
+        else:
+            self.folders_found.emit(folders)
+    
+    @Slot(list)
+    def on_folders_found(self, folders):
+        """Show the folders found by the search thread."""
+        self.btn_find_folders.setEnabled(True)
+        self.btn_scan.setEnabled(True)
+        self.mail_folders = folders
+        self.update_folder_list()
+    
+    @Slot(str)
+    def on_folder_search_failed(self, error):
+        """Report a failed folder search."""
+        self.btn_find_folders.setEnabled(True)
+        self.btn_scan.setEnabled(True)
+        QMessageBox.critical(self, get_string('error'), 
+                           get_string('error_finding_folders').format(error=error))
     
     def update_folder_list(self):
-        """Update the folder list widget with found mail folders."""
-        self.folder_list.clear()
+        """
+        Update the folder list widget with found mail folders.
+        
+        Only the rows that differ from the displayed list are removed or
+        inserted, so searching an unchanged profile again touches nothing
+        and keeps the selection of the folders that are still there.
+        """
+        new_folders = [(folder['display_name'], folder['path']) for folder in self.mail_folders]
+        if new_folders == self._displayed_folders:
+            return
+        
+        opcodes = SequenceMatcher(None, self._displayed_folders, new_folders,
+                                  autojunk=False).get_opcodes()
+        
+        # Edit the list without repainting after every row
+        self.folder_list.setUpdatesEnabled(False)
+        try:
+            # Apply the edits back to front so earlier row numbers stay valid
+            for tag, i1, i2, j1, j2 in reversed(opcodes):
+                if tag == 'equal':
+                    continue
+                
+                # Each range is removed and inserted with a single call; the
+                # paths are looked up in _displayed_folders by row
+                if i2 > i1:
+                    self.folder_list.model().removeRows(i1, i2 - i1)
+                if j2 > j1:
+                    self.folder_list.insertItems(
+                        i1, [display_name for display_name, _ in new_folders[j1:j2]]
+                    )
+        finally:
+            self.folder_list.setUpdatesEnabled(True)
         
-        for folder in self.mail_folders:
-            item = QListWidgetItem(folder['name'])
-            item.setData(Qt.UserRole, folder['path'])
-            self.folder_list.addItem(item)
+        self._displayed_folders = new_folders
     
     def select_all_folders(self):
         """Select all folders in the list."""
@@ -168,8 +241,11 @@ class ScanTab(QWidget):
                               get_string('no_folders_selected'))
             return
         
-        # Get selected folder paths
-        selected_paths = [item.data(Qt.UserRole) for item in selected_items]
+        # Get selected folder paths (rows match _displayed_folders)
+        selected_paths = [
+            self._displayed_folders[self.folder_list.row(item)][1]
+            for item in selected_items
+        ]
         
         # Get scan criteria
         criteria = "strict"